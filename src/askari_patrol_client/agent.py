@@ -45,6 +45,7 @@ See Also:
     - MCP Protocol: https://modelcontextprotocol.io/
 """
 
+import asyncio
 import json
 import logging
 import os
@@ -88,6 +89,92 @@ class AuthenticationError(Exception):
     pass
 
 
+class MCPConnection:
+    """
+    An MCP server connection entered and exited by its own owner task.
+
+    ``MCPServerStreamableHTTP`` opens anyio cancel scopes on enter, which must
+    be closed by the same task. Connections are opened by one task (a request
+    or the warm pool's refill) but closed by another (disconnect, LRU
+    eviction, the idle sweep or shutdown), so a dedicated task holds the
+    server open until close() is called.
+
+    Attributes:
+        server (MCPServerStreamableHTTP): The server, entered once open() returns
+
+    Example:
+        >>> connection = MCPConnection(MCPServerStreamableHTTP(url))
+        >>> await connection.open()
+        >>> await connection.server.direct_call_tool("is_authenticated", {})
+        >>> await connection.close()
+    """
+
+    def __init__(self, server: MCPServerStreamableHTTP):
+        """
+        Wrap a server without connecting.
+
+        Args:
+            server: The MCP server to hold open
+        """
+        self.server = server
+        self._owner: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+
+    async def _hold(self, ready: asyncio.Future) -> None:
+        """
+        Enter the server, signal ``ready`` and stay entered until close.
+        """
+        try:
+            async with self.server:
+                ready.set_result(None)
+                await self._closing.wait()
+        except BaseException as e:
+            # Errors after connecting surface from close(), which awaits us
+            if ready.done():
+                raise
+            ready.set_exception(e)
+
+    async def open(self) -> None:
+        """
+        Connect the server from a new owner task.
+
+        Raises:
+            Exception: If the MCP server cannot be reached or initialized
+        """
+        ready = asyncio.get_running_loop().create_future()
+        self._owner = asyncio.create_task(self._hold(ready))
+        try:
+            await ready
+        except asyncio.CancelledError:
+            # Don't leave the owner connecting in the background
+            self._owner.cancel()
+            self._owner = None
+            raise
+
+    async def ping(self) -> None:
+        """
+        Check the open session is still alive with a protocol-level ping.
+
+        Raises:
+            Exception: If the server does not answer, e.g. because it
+                restarted or dropped the session
+        """
+        # pydantic-ai has no public ping; use the session it opened on enter
+        await self.server._client.send_ping()
+
+    async def close(self) -> None:
+        """
+        Ask the owner task to exit the server and wait for it to finish.
+
+        Raises:
+            Exception: Any error raised while exiting the server
+        """
+        owner, self._owner = self._owner, None
+        if owner is not None:
+            self._closing.set()
+            await owner
+
+
 class AskariAgent:
     """
     MCP-powered conversational agent with persistent history management.
@@ -152,6 +239,7 @@ class AskariAgent:
         self.history_limit = history_limit
 
         # Private state - initialized in connect()
+        self._connection: MCPConnection | None = None
         self._server: MCPServerStreamableHTTP | None = None
         self._agent: Agent | None = None
         self._history: list[ModelMessage] = []
@@ -184,12 +272,12 @@ class AskariAgent:
                     "OPENAI_API_KEY environment variable is required for OpenAI models"
                 )
 
-    async def connect(self) -> None:
+    async def connect(self, connection: MCPConnection | None = None) -> None:
         """
         Establish MCP server connection and initialize agent runtime.
 
         This method performs the following initialization sequence:
-        1. Connects to the MCPServerStreamableHTTP endpoint
+        1. Connects to the MCPServerStreamableHTTP endpoint (or adopts ``connection``)
         2. Configures the Pydantic AI agent with model, tools, and processors
         3. Loads and reconstructs conversation history from database (if phone_number set)
         4. Applies automatic healing to recover from crashed sessions
@@ -198,6 +286,11 @@ class AskariAgent:
         the context window stays within token limits while preserving message
         integrity through turn-aware trimming.
 
+        Args:
+            connection: Optional MCP connection that is already open (e.g. from
+                a warm connection pool). The agent takes ownership and closes
+                it on disconnect. If None, a new connection is opened.
+
         Raises:
             ConnectionError: If MCP server is unreachable
             ValueError: If model identifier is invalid
@@ -208,10 +301,29 @@ class AskariAgent:
             >>> await agent.connect()
             >>> # Agent is now ready for conversation
         """
-        # Establish MCP server connection
-        self._server = MCPServerStreamableHTTP(self.server_url)
-        await self._server.__aenter__()
+        # Establish MCP server connection, unless a pre-connected one was given
+        if connection is None:
+            connection = MCPConnection(MCPServerStreamableHTTP(self.server_url))
+            await connection.open()
+        self._connection = connection
+        self._server = connection.server
+        try:
+            await self._set_up_agent()
+        except BaseException:
+            # The connection is ours now; don't leave its owner task waiting
+            try:
+                await self.disconnect()
+            except Exception as e:
+                logger.warning(
+                    "Error closing MCP connection after failed connect: %s", e
+                )
+            raise
 
+    async def _set_up_agent(self) -> None:
+        """
+        Build the Pydantic AI agent on the connected server, then load history
+        and restore the session.
+        """
         # Internal tools that the Python client calls directly via direct_call_tool.
         # These are filtered *out* of the LLM's tool list so it can never invoke
         # them autonomously — they are not visible to the model at all.
@@ -337,10 +449,11 @@ class AskariAgent:
             >>> # ... use agent ...
             >>> await agent.disconnect()
         """
-        if self._server:
-            await self._server.__aexit__(None, None, None)
+        if self._connection:
+            connection, self._connection = self._connection, None
             self._server = None
             self._agent = None
+            await connection.close()
 
     async def is_authenticated(self) -> bool:
         """
@@ -427,13 +540,13 @@ class AskariAgent:
 
             if not is_login_attempt:
                 logger.warning(
-                    f"Blocking unauthenticated request from {self.phone_number}"
+                    "Blocking unauthenticated request from %s", self.phone_number
                 )
                 raise AuthenticationError(
                     "Authentication required. Please log in first."
                 )
 
-            logger.info(f"Allowing potential login attempt from {self.phone_number}")
+            logger.info("Allowing potential login attempt from %s", self.phone_number)
 
         # Execute agent with optional conversation history
         result = await self._agent.run(
@@ -69,9 +69,9 @@ class ConversationDB:
         if db_dir != Path(".") and not db_dir.exists():
             try:
                 db_dir.mkdir(parents=True, exist_ok=True)
-                logger.info(f"Created database directory: {db_dir}")
+                logger.info("Created database directory: %s", db_dir)
             except OSError as e:
-                logger.error(f"Failed to create database directory {db_dir}: {e}")
+                logger.error("Failed to create database directory %s: %s", db_dir, e)
                 raise
 
     async def initialize(self):
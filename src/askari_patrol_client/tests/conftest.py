@@ -0,0 +1,6 @@
+import os
+
+# whatsapp_client reads its Twilio settings at import time
+os.environ.setdefault("TWILIO_ACCOUNT_SID", "ACtest")
+os.environ.setdefault("TWILIO_AUTH_TOKEN", "test-token")
+os.environ.setdefault("TWILIO_WHATSAPP_NUMBER", "+10000000000")
@@ -6,13 +6,14 @@ by proactively attempting to restore the session from the conversation history
 before proceeding with user requests.
 """
 
+import asyncio
 import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic_ai.messages import ModelResponse, ToolReturnPart
 
-from askari_patrol_client.agent import AskariAgent
+from askari_patrol_client.agent import AskariAgent, MCPConnection
 
 
 @pytest.mark.asyncio
@@ -107,3 +108,73 @@ async def test_run_restores_session_when_expired_if_history_exists():
 
         # Verify that the LLM was indeed invoked after successful restoration
         mock_ai_agent.run.assert_called_once()
+
+
+class _TaskRecordingServer:
+    """Stand-in MCP server recording which task entered and exited it."""
+
+    def __init__(self, fail_on_enter: bool = False):
+        self.fail_on_enter = fail_on_enter
+        self.entered_by = None
+        self.exited_by = None
+
+    async def __aenter__(self):
+        if self.fail_on_enter:
+            raise ConnectionError("unreachable")
+        self.entered_by = asyncio.current_task()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.exited_by = asyncio.current_task()
+
+    def filtered(self, predicate):
+        return self
+
+
+@pytest.mark.asyncio
+async def test_mcp_connection_closes_in_the_task_that_opened_it():
+    """
+    Test that a connection opened in one task and closed from another is
+    entered and exited by the same owner task, as anyio cancel scopes require.
+    """
+    server = _TaskRecordingServer()
+    connection = MCPConnection(server)
+
+    await asyncio.create_task(connection.open())
+    await asyncio.create_task(connection.close())
+
+    assert server.entered_by is not None
+    assert server.exited_by is server.entered_by
+
+
+@pytest.mark.asyncio
+async def test_mcp_connection_open_raises_connect_errors():
+    """Test that a failed connect is raised from open()."""
+    connection = MCPConnection(_TaskRecordingServer(fail_on_enter=True))
+
+    with pytest.raises(ConnectionError):
+        await connection.open()
+
+
+@pytest.mark.asyncio
+async def test_connect_closes_adopted_connection_when_setup_fails():
+    """
+    Test that a pooled connection adopted by connect() is closed, rather than
+    left with its owner task waiting forever, when the rest of connect fails.
+    """
+    server = _TaskRecordingServer()
+    connection = MCPConnection(server)
+    await connection.open()
+
+    mock_db = MagicMock()
+    mock_db.load_history = AsyncMock(side_effect=RuntimeError("database locked"))
+
+    with patch("askari_patrol_client.agent.Agent"), patch(
+        "askari_patrol_client.agent.ConversationDB", return_value=mock_db
+    ), patch.dict("os.environ", {"GOOGLE_API_KEY": "dummy"}):
+        agent = AskariAgent(phone_number="test_user")
+        with pytest.raises(RuntimeError):
+            await agent.connect(connection=connection)
+
+    assert server.exited_by is server.entered_by
+    assert agent._connection is None
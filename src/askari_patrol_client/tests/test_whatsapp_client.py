@@ -0,0 +1,329 @@
+"""
+Unit tests for the WhatsApp client's session, queueing and delivery logic.
+
+Agents are replaced with in-memory fakes and Twilio traffic is intercepted
+with respx, so no MCP server or Twilio account is needed.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from askari_patrol_client import whatsapp_client
+from askari_patrol_client.whatsapp_client import (
+    MCPWarmPool,
+    PendingMessage,
+    RateLimiter,
+    SessionManager,
+    cached_health_check,
+    process_message_task,
+    twilio_send,
+)
+
+PHONE = "+256700000001"
+OTHER_PHONE = "+256700000002"
+
+
+class FakeAgent:
+    """Stand-in for AskariAgent that records its lifecycle and turns."""
+
+    def __init__(self, **kwargs):
+        self.phone_number = kwargs.get("phone_number")
+        self.connected = False
+        self.disconnected = False
+        self.messages: list[str] = []
+        self.on_run = None
+
+    async def connect(self, connection=None):
+        self.connected = True
+
+    async def disconnect(self):
+        self.disconnected = True
+
+    async def run(self, message: str) -> str:
+        self.messages.append(message)
+        if self.on_run is not None:
+            self.on_run()
+        return f"reply to {message}"
+
+
+class FakeConnection:
+    """Stand-in for MCPConnection whose ping succeeds or fails."""
+
+    def __init__(self, alive: bool = True):
+        self.alive = alive
+        self.closed = False
+
+    async def ping(self):
+        if not self.alive:
+            raise ConnectionError("session not found")
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def session_manager(monkeypatch):
+    monkeypatch.setattr(whatsapp_client, "AskariAgent", FakeAgent)
+    return SessionManager("http://mcp.test/mcp", "instructions", max_sessions=1)
+
+
+@pytest.fixture
+def twilio_http():
+    return httpx.AsyncClient(base_url=whatsapp_client.TWILIO_API_BASE_URL)
+
+
+class TestMessageQueue:
+    """Test ordering and coalescing of messages queued for one phone."""
+
+    def test_take_pending_coalesces_in_arrival_order(self, session_manager):
+        session_manager.start_processing(PHONE)
+        session_manager.enqueue(PHONE, PendingMessage("Hi", "SM1"))
+        session_manager.enqueue(PHONE, PendingMessage("", "SM2"))
+        session_manager.enqueue(PHONE, PendingMessage("Anyone?", "SM3"))
+
+        pending = session_manager.take_pending(PHONE)
+
+        assert pending == PendingMessage("Hi\nAnyone?", "SM3")
+        assert session_manager.take_pending(PHONE) is None
+
+    def test_finish_processing_discards_queue(self, session_manager):
+        session_manager.start_processing(PHONE)
+        session_manager.enqueue(PHONE, PendingMessage("Hi", "SM1"))
+
+        session_manager.finish_processing(PHONE)
+
+        assert not session_manager.is_processing(PHONE)
+        assert session_manager.take_pending(PHONE) is None
+
+    @pytest.mark.asyncio
+    async def test_messages_queued_during_a_turn_follow_as_one_turn(
+        self, monkeypatch, session_manager, twilio_http
+    ):
+        replies = []
+
+        async def record_reply(http, phone_number, text):
+            replies.append(text)
+
+        async def no_typing(http, message_sid):
+            pass
+
+        monkeypatch.setattr(whatsapp_client, "send_whatsapp_message_safe", record_reply)
+        monkeypatch.setattr(whatsapp_client, "send_typing_indicator_safe", no_typing)
+
+        agent = FakeAgent()
+
+        def queue_follow_ups():
+            agent.on_run = None
+            session_manager.enqueue(PHONE, PendingMessage("second", "SM2"))
+            session_manager.enqueue(PHONE, PendingMessage("third", "SM3"))
+
+        agent.on_run = queue_follow_ups
+        session_manager.start_processing(PHONE)
+
+        await process_message_task(
+            agent, PHONE, "first", "SM1", session_manager, twilio_http
+        )
+        await asyncio.gather(*whatsapp_client._background_tasks)
+
+        assert agent.messages == ["first", "second\nthird"]
+        assert replies == ["reply to first", "reply to second\nthird"]
+        assert not session_manager.is_processing(PHONE)
+
+
+class TestSessionManager:
+    """Test session reuse, LRU eviction and the idle sweep."""
+
+    @pytest.mark.asyncio
+    async def test_session_is_reused(self, session_manager):
+        first = await session_manager.get_or_create_session(PHONE)
+        second = await session_manager.get_or_create_session(PHONE)
+
+        assert first is second
+        assert first.connected
+
+    @pytest.mark.asyncio
+    async def test_eviction_closes_least_recently_used_agent(self, session_manager):
+        evicted = await session_manager.get_or_create_session(PHONE)
+        kept = await session_manager.get_or_create_session(OTHER_PHONE)
+
+        assert evicted.disconnected
+        assert not kept.disconnected
+        assert list(session_manager.sessions) == [OTHER_PHONE]
+
+    @pytest.mark.asyncio
+    async def test_eviction_skips_sessions_being_processed(self, session_manager):
+        busy = await session_manager.get_or_create_session(PHONE)
+        session_manager.start_processing(PHONE)
+
+        await session_manager.get_or_create_session(OTHER_PHONE)
+
+        assert not busy.disconnected
+        assert PHONE in session_manager.sessions
+
+    @pytest.mark.asyncio
+    async def test_sweep_idle_closes_only_idle_sessions(self, session_manager):
+        session_manager.max_sessions = 2
+        session_manager.idle_timeout = 0
+        idle = await session_manager.get_or_create_session(PHONE)
+        busy = await session_manager.get_or_create_session(OTHER_PHONE)
+        session_manager.start_processing(OTHER_PHONE)
+
+        closed = await session_manager.sweep_idle()
+
+        assert closed == 1
+        assert idle.disconnected
+        assert not busy.disconnected
+        assert list(session_manager.sessions) == [OTHER_PHONE]
+
+
+class TestMCPWarmPool:
+    """Test that only live pooled connections are handed out."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_discards_connections_that_fail_ping(self):
+        # size=0 keeps acquire() from starting a real background refill
+        pool = MCPWarmPool("http://mcp.test/mcp", size=0)
+        dead, live = FakeConnection(alive=False), FakeConnection()
+        pool._ready.put_nowait(dead)
+        pool._ready.put_nowait(live)
+
+        assert await pool.acquire() is live
+        assert dead.closed
+        assert not live.closed
+
+    @pytest.mark.asyncio
+    async def test_acquire_returns_none_when_all_pooled_are_dead(self):
+        pool = MCPWarmPool("http://mcp.test/mcp", size=0)
+        dead = FakeConnection(alive=False)
+        pool._ready.put_nowait(dead)
+
+        assert await pool.acquire() is None
+        assert dead.closed
+
+
+class TestTwilioSend:
+    """Test retries of transient Twilio failures."""
+
+    @pytest.fixture(autouse=True)
+    def _no_backoff(self, monkeypatch):
+        monkeypatch.setattr(whatsapp_client, "SEND_RETRY_BACKOFF", 0)
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_transient_error_is_retried(self, respx_mock, twilio_http, status):
+        route = respx_mock.post(
+            f"{whatsapp_client.TWILIO_API_BASE_URL}{whatsapp_client.TWILIO_MESSAGES_PATH}"
+        ).mock(side_effect=[httpx.Response(status), httpx.Response(201)])
+
+        await twilio_send(twilio_http, f"whatsapp:{PHONE}", "Hello")
+
+        assert route.call_count == 2
+        assert route.calls.last.request.content == (
+            b"From=whatsapp%3A%2B10000000000&To=whatsapp%3A%2B256700000001&Body=Hello"
+        )
+
+    @pytest.mark.asyncio
+    async def test_network_error_is_retried(self, respx_mock, twilio_http):
+        route = respx_mock.post(
+            f"{whatsapp_client.TWILIO_API_BASE_URL}{whatsapp_client.TWILIO_MESSAGES_PATH}"
+        ).mock(side_effect=[httpx.ConnectError("refused"), httpx.Response(201)])
+
+        await twilio_send(twilio_http, f"whatsapp:{PHONE}", "Hello")
+
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_send_attempts(self, respx_mock, twilio_http):
+        route = respx_mock.post(
+            f"{whatsapp_client.TWILIO_API_BASE_URL}{whatsapp_client.TWILIO_MESSAGES_PATH}"
+        ).mock(return_value=httpx.Response(503))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await twilio_send(twilio_http, f"whatsapp:{PHONE}", "Hello")
+
+        assert route.call_count == whatsapp_client.SEND_ATTEMPTS
+
+    @pytest.mark.asyncio
+    async def test_client_error_is_not_retried(self, respx_mock, twilio_http):
+        route = respx_mock.post(
+            f"{whatsapp_client.TWILIO_API_BASE_URL}{whatsapp_client.TWILIO_MESSAGES_PATH}"
+        ).mock(return_value=httpx.Response(400))
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await twilio_send(twilio_http, f"whatsapp:{PHONE}", "Hello")
+
+        assert route.call_count == 1
+
+
+class TestCachedHealthCheck:
+    """Test the TTL cache in front of the /health probes."""
+
+    @pytest.fixture(autouse=True)
+    def _empty_cache(self, monkeypatch):
+        monkeypatch.setattr(whatsapp_client, "_health_cache", {})
+
+    @staticmethod
+    def _counting_probe(result=True):
+        calls = []
+
+        async def probe():
+            calls.append(None)
+            await asyncio.sleep(0)
+            return result
+
+        return probe, calls
+
+    @pytest.mark.asyncio
+    async def test_result_is_reused_within_ttl(self):
+        probe, calls = self._counting_probe()
+
+        assert await cached_health_check("probe", probe)
+        assert await cached_health_check("probe", probe)
+
+        assert len(calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_probe_runs_again_after_ttl(self, monkeypatch):
+        monkeypatch.setattr(whatsapp_client, "HEALTH_CHECK_TTL", 0)
+        probe, calls = self._counting_probe(result=False)
+
+        assert not await cached_health_check("probe", probe)
+        assert not await cached_health_check("probe", probe)
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_callers_share_one_probe(self):
+        probe, calls = self._counting_probe()
+
+        results = await asyncio.gather(
+            *(cached_health_check("probe", probe) for _ in range(5))
+        )
+
+        assert results == [True] * 5
+        assert len(calls) == 1
+
+
+class TestRateLimiter:
+    """Test the per-phone sliding window."""
+
+    def test_limits_after_max_messages(self):
+        limiter = RateLimiter(max_messages=2, window_seconds=60)
+
+        assert not limiter.is_rate_limited(PHONE)
+        assert not limiter.is_rate_limited(PHONE)
+        assert limiter.is_rate_limited(PHONE)
+        assert not limiter.is_rate_limited(OTHER_PHONE)
+        assert 0 < limiter.get_remaining_time(PHONE) <= 60
+
+    def test_sweep_drops_expired_buckets(self, monkeypatch):
+        limiter = RateLimiter(max_messages=2, window_seconds=60)
+        limiter.is_rate_limited(PHONE)
+
+        now = whatsapp_client.time.time()
+        monkeypatch.setattr(whatsapp_client.time, "time", lambda: now + 61)
+
+        assert limiter.sweep() == 1
+        assert limiter.get_remaining_time(PHONE) == 0
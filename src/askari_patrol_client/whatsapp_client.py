@@ -33,12 +33,19 @@ Environment Variables:
         ROLLBAR_SERVER_TOKEN: Rollbar token for error tracking
         RATE_LIMIT_MESSAGES: Max messages per window (default: 10)
         RATE_LIMIT_WINDOW: Rate limit window in seconds (default: 60)
+        HEALTH_CHECK_TTL: Seconds to cache /health probe results (default: 5)
+        MAX_SESSIONS: Max agent sessions kept open (default: 500)
+        SESSION_IDLE_TIMEOUT: Seconds before an idle session is closed (default: 1800)
+        MCP_WARM_POOL_SIZE: Pre-connected MCP sessions for new users (default: 2)
+        ASKARI_DEBUG: Enable debug logging for this module when set
+        WEB_CONCURRENCY: Uvicorn worker processes for main() (default: 1)
+        OUTBOUND_CONCURRENCY: Max concurrent Twilio message sends (default: 20)
 
 Usage:
     # Development
     python -m askari_patrol_client.server
 
-    # Production (with Gunicorn)
+    # Production (with Gunicorn; UvicornWorker runs on uvloop when installed)
     gunicorn askari_patrol_client.server:create_app --workers 4 --worker-class uvicorn.workers.UvicornWorker
 
 Endpoints:
@@ -51,30 +58,37 @@ See Also:
     - FastAPI Background Tasks: https://fastapi.tiangolo.com/tutorial/background-tasks/
 """
 
+import asyncio
 import logging
 import os
 import time
-from collections import defaultdict
-from contextlib import asynccontextmanager
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable, Coroutine
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import NamedTuple
 
+import httpx
 from common.rollbar_config import initialize_rollbar, report_error_to_rollbar_async
 from common.whatsapp import (
+    WHATSAPP_MESSAGE_LIMIT,
     convert_markdown_to_whatsapp,
-    send_typing_indicator,
+    send_typing_indicator_async,
     split_whatsapp_message,
 )
 from fastapi import BackgroundTasks, FastAPI, Form
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import ORJSONResponse, PlainTextResponse, Response
 from mcp import ClientSession
 from mcp.client.streamable_http import streamablehttp_client
+from pydantic_ai.mcp import MCPServerStreamableHTTP
 from rollbar.contrib.fastapi import add_to as rollbar_add_to
-from twilio.rest import Client
+from twilio.twiml.messaging_response import MessagingResponse
 
-from .agent import AskariAgent, AuthenticationError
+from .agent import AskariAgent, AuthenticationError, MCPConnection
 from .prompts import WHATSAPP_SYSTEM_PROMPT
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
+# Verbose logging is opt-in so production turns don't format debug records
+logger.setLevel(logging.DEBUG if os.environ.get("ASKARI_DEBUG") else logging.INFO)
 
 # Environment variable configuration
 TWILIO_ACCOUNT_SID = os.environ["TWILIO_ACCOUNT_SID"]
@@ -83,25 +97,116 @@ TWILIO_WHATSAPP_NUMBER = os.environ["TWILIO_WHATSAPP_NUMBER"]
 MCP_SERVER_URL = os.environ.get("MCP_SERVER_URL", "http://localhost:8000/mcp")
 ROLLBAR_SERVER_TOKEN = os.environ.get("ROLLBAR_SERVER_TOKEN")
 
+# Variables that must be set for the bot to work, checked by /health
+REQUIRED_ENV_VARS = (
+    "TWILIO_ACCOUNT_SID",
+    "TWILIO_AUTH_TOKEN",
+    "TWILIO_WHATSAPP_NUMBER",
+    "GOOGLE_API_KEY",
+)
+
+# The environment doesn't change while the process runs, so resolve the
+# /health env check once at import
+MISSING_ENV_VARS = tuple(var for var in REQUIRED_ENV_VARS if not os.environ.get(var))
+
+# Twilio sender address for outgoing WhatsApp messages
+FROM_WHATSAPP = f"whatsapp:{TWILIO_WHATSAPP_NUMBER}"
+
 # Rate limiting configuration
 RATE_LIMIT_MESSAGES = int(os.environ.get("RATE_LIMIT_MESSAGES", "10"))
 RATE_LIMIT_WINDOW = int(os.environ.get("RATE_LIMIT_WINDOW", "60"))
 
-# Initialize Twilio client
-twilio_client = Client(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN)
+# Seconds a /health probe result is reused before probing again
+HEALTH_CHECK_TTL = float(os.environ.get("HEALTH_CHECK_TTL", "5"))
+
+# Session and rate-limit memory bounds
+MAX_SESSIONS = int(os.environ.get("MAX_SESSIONS", "500"))
+SESSION_IDLE_TIMEOUT = int(os.environ.get("SESSION_IDLE_TIMEOUT", "1800"))
+MCP_WARM_POOL_SIZE = int(os.environ.get("MCP_WARM_POOL_SIZE", "2"))
+# Seconds a pooled MCP connection has to answer a ping before it is discarded
+MCP_WARM_PING_TIMEOUT = 5.0
+SWEEP_INTERVAL = 60
+
+# Twilio shows a typing indicator for a while after it is sent, so skip
+# re-sending it for the same user within this many seconds
+TYPING_DEBOUNCE_SECONDS = 8.0
+
+# Outbound Twilio sends: cap on concurrent requests and retry policy for
+# transient failures (exponential backoff starting at SEND_RETRY_BACKOFF)
+OUTBOUND_CONCURRENCY = int(os.environ.get("OUTBOUND_CONCURRENCY", "20"))
+SEND_ATTEMPTS = 3
+SEND_RETRY_BACKOFF = 0.5
+
+# Number of Uvicorn worker processes when run via main()
+WEB_CONCURRENCY = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+# Twilio REST endpoints used by the shared async HTTP client
+TWILIO_API_BASE_URL = "https://api.twilio.com"
+TWILIO_MESSAGES_PATH = f"/2010-04-01/Accounts/{TWILIO_ACCOUNT_SID}/Messages.json"
+
+# Connection pool sizing for Twilio: keep enough warm connections for bursts
+# of replies and typing indicators, and hold idle ones long enough to be
+# reused between webhook turns
+TWILIO_HTTP_LIMITS = httpx.Limits(
+    max_connections=64,
+    max_keepalive_connections=32,
+    keepalive_expiry=60.0,
+)
 
 # User-facing messages
 MSG_MEDIA_NOT_SUPPORTED = (
     "⚠️ Sorry, I can only process text messages. Please send your request as text."
 )
 MSG_RATE_LIMITED = "⚠️ You've reached the message limit. Please wait {} seconds before sending more messages."
-MSG_PROCESSING_PREVIOUS = "⏳ Please wait, I'm still processing your previous message."
 MSG_PROCESSING_ERROR = "I encountered an error processing your message."
 MSG_AUTH_REQUIRED = (
     "⚠️ Your session has expired or you are not logged in. "
     "To proceed, please provide your email address and password to authenticate."
 )
 
+# Strong references to fire-and-forget tasks so they aren't garbage collected
+# before completion (asyncio only keeps weak references to running tasks)
+_background_tasks: set[asyncio.Task] = set()
+
+# Bounds concurrent outbound Twilio message requests across all users
+_outbound_semaphore = asyncio.Semaphore(OUTBOUND_CONCURRENCY)
+
+
+def run_in_background(coro: Coroutine) -> asyncio.Task:
+    """
+    Schedule a coroutine on the running loop without awaiting it.
+
+    Args:
+        coro: Coroutine to run concurrently with the caller
+
+    Returns:
+        asyncio.Task: The scheduled task
+    """
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+def create_twilio_http_client() -> httpx.AsyncClient:
+    """
+    Create the shared async HTTP client used for Twilio REST calls.
+
+    A single pooled client keeps connections to Twilio alive across webhook
+    turns instead of paying a TCP+TLS handshake on every call. HTTP/2 lets
+    concurrent background sends share one connection.
+
+    Returns:
+        httpx.AsyncClient: Client authenticated with the Twilio account credentials
+    """
+    return httpx.AsyncClient(
+        base_url=TWILIO_API_BASE_URL,
+        auth=(TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN),
+        timeout=httpx.Timeout(10.0),
+        limits=TWILIO_HTTP_LIMITS,
+        http2=True,
+    )
+
 
 class RateLimiter:
     """
@@ -116,7 +221,8 @@ class RateLimiter:
     Attributes:
         max_messages (int): Maximum messages allowed per window
         window_seconds (int): Time window duration in seconds
-        message_timestamps (dict): Mapping of phone numbers to timestamp lists
+        message_timestamps (dict): Mapping of phone numbers to timestamp deques,
+            oldest first
 
     Example:
         >>> limiter = RateLimiter(max_messages=5, window_seconds=60)
@@ -139,7 +245,18 @@ class RateLimiter:
         """
         self.max_messages = max_messages
         self.window_seconds = window_seconds
-        self.message_timestamps: dict[str, list[float]] = defaultdict(list)
+        self.message_timestamps: dict[str, deque[float]] = {}
+
+    def _prune(self, timestamps: deque[float], now: float) -> None:
+        """
+        Drop timestamps that have left the window.
+
+        They are appended in order, so the expired ones are always at the
+        left end.
+        """
+        cutoff = now - self.window_seconds
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
 
     def is_rate_limited(self, phone_number: str) -> bool:
         """
@@ -165,18 +282,21 @@ class RateLimiter:
             False  # Second call adds timestamp
         """
         now = time.time()
-        timestamps = self.message_timestamps[phone_number]
+        timestamps = self.message_timestamps.get(phone_number)
 
-        # Clean up expired timestamps
-        cutoff = now - self.window_seconds
-        timestamps[:] = [ts for ts in timestamps if ts > cutoff]
+        if timestamps:
+            self._prune(timestamps, now)
 
         # Check if limit exceeded
-        if len(timestamps) >= self.max_messages:
+        if len(timestamps or ()) >= self.max_messages:
             return True
 
-        # Add current timestamp and allow message
-        timestamps.append(now)
+        # Add current timestamp and allow message; first-time senders only
+        # get a bucket once a message has actually been accepted
+        if timestamps is None:
+            self.message_timestamps[phone_number] = deque([now])
+        else:
+            timestamps.append(now)
         return False
 
     def get_remaining_time(self, phone_number: str) -> int:
@@ -193,18 +313,154 @@ class RateLimiter:
             >>> limiter.get_remaining_time("+1234567890")
             42  # 42 seconds until oldest message expires
         """
-        if phone_number not in self.message_timestamps:
+        timestamps = self.message_timestamps.get(phone_number)
+        if not timestamps:
             return 0
 
-        timestamps = self.message_timestamps[phone_number]
+        now = time.time()
+        self._prune(timestamps, now)
         if not timestamps:
             return 0
 
-        oldest = min(timestamps)
-        elapsed = time.time() - oldest
+        # Timestamps are kept in arrival order, so the oldest is first
+        elapsed = now - timestamps[0]
         remaining = max(0, self.window_seconds - elapsed)
         return int(remaining)
 
+    def sweep(self) -> int:
+        """
+        Drop buckets whose timestamps have all expired.
+
+        Returns:
+            int: Number of buckets removed
+
+        Example:
+            >>> limiter.sweep()
+            3  # three senders have been quiet for a full window
+        """
+        cutoff = time.time() - self.window_seconds
+        expired = [
+            phone_number
+            for phone_number, timestamps in self.message_timestamps.items()
+            if not timestamps or timestamps[-1] <= cutoff
+        ]
+        for phone_number in expired:
+            del self.message_timestamps[phone_number]
+        return len(expired)
+
+
+class MCPWarmPool:
+    """
+    Small pool of pre-connected MCP servers for new agent sessions.
+
+    A user's first message would otherwise wait for a full MCP connect and
+    initialize handshake before the agent can start. The pool keeps a few
+    connections ready and refills itself in the background whenever one is
+    taken. Pooled connections are unauthenticated, so any user can adopt one.
+    Each is an MCPConnection held open by its own owner task, so whichever
+    task later disconnects the adopting agent can close it safely. A pooled
+    connection may have been dropped by the server while it waited (e.g. on
+    a server restart), so each is pinged before it is handed out.
+
+    Attributes:
+        mcp_server_url (str): MCP server endpoint URL
+        size (int): Number of connections kept ready (0 disables the pool)
+
+    Example:
+        >>> pool = MCPWarmPool("http://localhost:8000/mcp", size=2)
+        >>> pool.refill()
+        >>> connection = await pool.acquire()  # None if nothing live is ready
+    """
+
+    def __init__(self, mcp_server_url: str, size: int):
+        """
+        Initialize an empty pool; call refill() to start connecting.
+
+        Args:
+            mcp_server_url: URL of the MCP server to connect to
+            size: Number of connections to keep ready
+        """
+        self.mcp_server_url = mcp_server_url
+        self.size = size
+        self._ready: asyncio.Queue[MCPConnection] = asyncio.Queue()
+        self._refill_task: asyncio.Task | None = None
+
+    async def acquire(self) -> MCPConnection | None:
+        """
+        Take a ready connection that still answers a ping, if any, and start
+        refilling the pool.
+
+        Connections that fail the ping are closed and skipped.
+
+        Returns:
+            MCPConnection | None: An open MCP connection now owned by the
+            caller, or None if no live one is ready
+        """
+        connection = None
+        while connection is None and not self._ready.empty():
+            connection = self._ready.get_nowait()
+            try:
+                async with asyncio.timeout(MCP_WARM_PING_TIMEOUT):
+                    await connection.ping()
+            except Exception as e:
+                logger.warning("Discarding dead warm MCP connection: %s", e)
+                await self._discard(connection)
+                connection = None
+        self.refill()
+        return connection
+
+    async def _discard(self, connection: MCPConnection) -> None:
+        """
+        Close a connection taken from the pool, logging any error.
+        """
+        try:
+            await connection.close()
+        except Exception as e:
+            logger.warning("Error closing warm MCP connection: %s", e)
+
+    def refill(self) -> None:
+        """
+        Top the pool up in the background unless a refill is already running.
+        """
+        if self.size > 0 and (self._refill_task is None or self._refill_task.done()):
+            self._refill_task = run_in_background(self._fill())
+
+    async def _fill(self) -> None:
+        """
+        Connect until the pool is full; stop at the first failure and leave
+        the retry to the next acquire().
+        """
+        while self._ready.qsize() < self.size:
+            connection = MCPConnection(MCPServerStreamableHTTP(self.mcp_server_url))
+            try:
+                await connection.open()
+            except Exception as e:
+                logger.warning("MCP warm-up connection failed: %s", e)
+                return
+            self._ready.put_nowait(connection)
+
+    async def close(self) -> None:
+        """
+        Stop refilling and close all ready connections.
+        """
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+        while not self._ready.empty():
+            await self._discard(self._ready.get_nowait())
+
+
+class PendingMessage(NamedTuple):
+    """
+    A message received while an earlier one from the same user is in progress.
+
+    Attributes:
+        body (str): The message text
+        message_sid (str): Twilio message identifier
+    """
+
+    body: str
+    message_sid: str
+
 
 class SessionManager:
     """
@@ -212,14 +468,19 @@ class SessionManager:
 
     Maintains one long-lived agent instance per phone number, enabling
     conversation continuity and reducing connection overhead. Also tracks
-    which users are currently being processed to prevent concurrent message
-    handling issues.
+    which users are currently being processed, queueing their follow-up
+    messages so they are answered after the current one instead of dropped.
 
     Attributes:
         mcp_server_url (str): MCP server endpoint URL
         instructions (str): System prompt for agent initialization
-        sessions (dict): Mapping of phone numbers to AskariAgent instances
-        processing (set): Phone numbers currently being processed
+        sessions (OrderedDict): Mapping of phone numbers to AskariAgent
+            instances, least recently used first
+        inflight (dict): Phone numbers currently being processed, mapped to
+            the queue of messages received meanwhile
+        max_sessions (int): Maximum number of sessions kept open
+        idle_timeout (int): Seconds of inactivity before a session is closed
+        last_typing (dict): When a typing indicator was last sent per phone
 
     Example:
         >>> manager = SessionManager("http://localhost:8000/mcp", "You are...")
@@ -229,18 +490,37 @@ class SessionManager:
         >>> assert agent is same_agent
     """
 
-    def __init__(self, mcp_server_url: str, instructions: str):
+    def __init__(
+        self,
+        mcp_server_url: str,
+        instructions: str,
+        max_sessions: int = MAX_SESSIONS,
+        idle_timeout: int = SESSION_IDLE_TIMEOUT,
+        warm_pool: MCPWarmPool | None = None,
+    ):
         """
         Initialize the session manager.
 
         Args:
             mcp_server_url: URL of the MCP server to connect to
             instructions: System prompt/instructions for agent behavior
+            max_sessions: Maximum number of sessions kept open; the least
+                recently used idle session is closed beyond this
+            idle_timeout: Seconds of inactivity before sweep_idle closes a session
+            warm_pool: Optional pool of pre-connected MCP servers used for
+                new sessions
         """
         self.mcp_server_url = mcp_server_url
         self.instructions = instructions
-        self.sessions: dict[str, AskariAgent] = {}
-        self.processing: set[str] = set()
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self.warm_pool = warm_pool
+        self.sessions: OrderedDict[str, AskariAgent] = OrderedDict()
+        self.last_used: dict[str, float] = {}
+        self.last_typing: dict[str, float] = {}
+        self.inflight: dict[str, asyncio.Queue[PendingMessage]] = {}
+        # Per-phone locks so concurrent first messages connect only one agent
+        self._create_locks: dict[str, asyncio.Lock] = {}
 
     async def get_or_create_session(self, phone_number: str) -> AskariAgent:
         """
@@ -258,23 +538,118 @@ class SessionManager:
 
         Side Effects:
             - Creates and connects new agent if not exists
+            - Closes the least recently used session when over max_sessions
             - Logs session creation
 
         Example:
             >>> agent = await manager.get_or_create_session("+1234567890")
             >>> response = await agent.run("Hello")
         """
-        if phone_number not in self.sessions:
-            logger.info(f"Creating new agent session for {phone_number}")
-            agent = AskariAgent(
-                server_url=self.mcp_server_url,
-                instructions=self.instructions,
-                phone_number=phone_number,
-            )
-            await agent.connect()
-            self.sessions[phone_number] = agent
+        agent = self.sessions.get(phone_number)
+        if agent is None:
+            lock = self._create_locks.setdefault(phone_number, asyncio.Lock())
+            async with lock:
+                # Re-check: another request may have connected while we waited
+                agent = self.sessions.get(phone_number)
+                if agent is None:
+                    logger.info("Creating new agent session for %s", phone_number)
+                    agent = AskariAgent(
+                        server_url=self.mcp_server_url,
+                        instructions=self.instructions,
+                        phone_number=phone_number,
+                    )
+                    # Adopt a pre-connected MCP session when a live one is ready
+                    connection = (
+                        await self.warm_pool.acquire() if self.warm_pool else None
+                    )
+                    await agent.connect(connection=connection)
+                    self.sessions[phone_number] = agent
+                    await self._evict_overflow()
+        else:
+            self.sessions.move_to_end(phone_number)
+
+        self.last_used[phone_number] = time.monotonic()
+        return agent
+
+    async def _evict_overflow(self) -> None:
+        """
+        Close least recently used sessions until within max_sessions.
+
+        Sessions that are currently processing a message are skipped.
+        """
+        overflow = len(self.sessions) - self.max_sessions
+        if overflow <= 0:
+            return
+
+        victims = [pn for pn in self.sessions if pn not in self.inflight][:overflow]
+        for phone_number in victims:
+            logger.info("Evicting least recently used session for %s", phone_number)
+            await self.close_session(phone_number)
+
+    async def sweep_idle(self) -> int:
+        """
+        Close sessions that have been idle longer than idle_timeout.
+
+        Returns:
+            int: Number of sessions closed
 
-        return self.sessions[phone_number]
+        Example:
+            >>> await manager.sweep_idle()
+            2
+        """
+        cutoff = time.monotonic() - self.idle_timeout
+        idle = [
+            phone_number
+            for phone_number in self.sessions
+            if phone_number not in self.inflight
+            and self.last_used.get(phone_number, 0.0) <= cutoff
+        ]
+        for phone_number in idle:
+            logger.info("Closing idle session for %s", phone_number)
+            await self.close_session(phone_number)
+        return len(idle)
+
+    async def close_session(self, phone_number: str) -> None:
+        """
+        Disconnect and forget the session for a single user.
+
+        Args:
+            phone_number: User's phone number
+
+        Side Effects:
+            - Disconnects the agent's MCP connection
+            - Logs any disconnection errors
+        """
+        agent = self.sessions.pop(phone_number, None)
+        self.last_used.pop(phone_number, None)
+        self.last_typing.pop(phone_number, None)
+        self._create_locks.pop(phone_number, None)
+        if agent is None:
+            return
+        try:
+            await agent.disconnect()
+        except Exception as e:
+            logger.error("Error closing session for %s: %s", phone_number, e)
+
+    def should_send_typing(self, phone_number: str) -> bool:
+        """
+        Decide whether to send a typing indicator, debouncing repeats.
+
+        Args:
+            phone_number: User's phone number
+
+        Returns:
+            bool: True if no indicator was sent within TYPING_DEBOUNCE_SECONDS
+
+        Side Effects:
+            Records the send time when returning True
+        """
+        now = time.monotonic()
+        last = self.last_typing.get(phone_number)
+        if last is not None and now - last < TYPING_DEBOUNCE_SECONDS:
+            return False
+        self.last_typing[phone_number] = now
+        return True
 
     def is_processing(self, phone_number: str) -> bool:
         """
@@ -296,7 +671,7 @@ class SessionManager:
             >>> manager.is_processing("+1234567890")
             True
         """
-        return phone_number in self.processing
+        return phone_number in self.inflight
 
     def start_processing(self, phone_number: str) -> None:
         """
@@ -306,9 +681,49 @@ class SessionManager:
             phone_number: User's phone number
 
         Side Effects:
-            Adds phone number to the processing set
+            Creates an empty pending-message queue for the phone number
+        """
+        self.inflight[phone_number] = asyncio.Queue()
+
+    def enqueue(self, phone_number: str, message: PendingMessage) -> None:
+        """
+        Queue a message behind the one currently being processed.
+
+        Args:
+            phone_number: User's phone number (must be processing)
+            message: The message to answer once the current one is done
+        """
+        self.inflight[phone_number].put_nowait(message)
+
+    def take_pending(self, phone_number: str) -> PendingMessage | None:
+        """
+        Drain queued messages for a user, coalesced into a single turn.
+
+        Bodies are joined with newlines and the latest message SID is kept
+        for the typing indicator.
+
+        Args:
+            phone_number: User's phone number
+
+        Returns:
+            PendingMessage | None: The coalesced message, or None if nothing
+            was queued
+
+        Example:
+            >>> manager.enqueue("+1234567890", PendingMessage("Hi", "SM1"))
+            >>> manager.enqueue("+1234567890", PendingMessage("Anyone?", "SM2"))
+            >>> manager.take_pending("+1234567890")
+            PendingMessage(body='Hi\nAnyone?', message_sid='SM2')
         """
-        self.processing.add(phone_number)
+        queue = self.inflight.get(phone_number)
+        if queue is None or queue.empty():
+            return None
+
+        messages = [queue.get_nowait() for _ in range(queue.qsize())]
+        return PendingMessage(
+            body="\n".join(m.body for m in messages if m.body),
+            message_sid=messages[-1].message_sid,
+        )
 
     def finish_processing(self, phone_number: str) -> None:
         """
@@ -318,13 +733,13 @@ class SessionManager:
             phone_number: User's phone number
 
         Side Effects:
-            Removes phone number from the processing set
+            Removes the phone number and discards any unanswered queued messages
 
         Note:
-            Uses discard() instead of remove() to avoid KeyError if
-            the phone number wasn't in the set.
+            Uses pop() with a default to avoid KeyError if the phone number
+            wasn't being processed.
         """
-        self.processing.discard(phone_number)
+        self.inflight.pop(phone_number, None)
 
     async def close_all(self) -> None:
         """
@@ -346,42 +761,174 @@ class SessionManager:
             try:
                 await agent.disconnect()
             except Exception as e:
-                logger.error(f"Error closing session for {phone_number}: {e}")
+                logger.error("Error closing session for %s: %s", phone_number, e)
         self.sessions.clear()
+        self.last_used.clear()
+        self.last_typing.clear()
+        self._create_locks.clear()
 
 
-async def is_mcp_server_healthy(mcp_server_url: str) -> bool:
+class HealthProbe:
+    """
+    Long-lived MCP session used by the /health endpoint.
+
+    Keeps one streamable-HTTP transport and initialized ClientSession open
+    so each probe is a single protocol ping rather than a TCP/TLS connect
+    plus MCP initialize handshake. A failed ping drops the session and the
+    next probe reconnects lazily.
+
+    The transport is entered and exited inside a dedicated owner task, since
+    its anyio cancel scopes must be closed by the task that opened them and
+    probes arrive on whichever request task happens to hit /health.
+
+    Attributes:
+        mcp_server_url (str): MCP server endpoint URL
+        session (ClientSession | None): Connected session, None when down
+
+    Example:
+        >>> probe = HealthProbe("http://localhost:8000/mcp")
+        >>> await probe.ping()
+        True
+        >>> await probe.close()
     """
-    Verify MCP server is reachable and responding correctly.
 
-    Performs a health check by connecting to the MCP server and calling
-    the is_healthy tool. Used by the /health endpoint to monitor system status.
+    def __init__(self, mcp_server_url: str):
+        """
+        Initialize the probe without connecting.
+
+        Args:
+            mcp_server_url: URL of the MCP server to check
+        """
+        self.mcp_server_url = mcp_server_url
+        self.session: ClientSession | None = None
+        self._owner: asyncio.Task | None = None
+        self._closing = asyncio.Event()
+
+    async def _hold_session(self, ready: asyncio.Future) -> None:
+        """
+        Open the session, publish it via ``ready`` and keep it open until close.
+        """
+        try:
+            async with AsyncExitStack() as exit_stack:
+                read_stream, write_stream, _ = await exit_stack.enter_async_context(
+                    streamablehttp_client(self.mcp_server_url)
+                )
+                session = await exit_stack.enter_async_context(
+                    ClientSession(read_stream, write_stream)
+                )
+                await session.initialize()
+                ready.set_result(session)
+                await self._closing.wait()
+        except BaseException as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not isinstance(e, Exception):
+                raise
+
+    async def connect(self) -> None:
+        """
+        Open the transport and initialize a persistent MCP session.
+
+        Raises:
+            Exception: If the MCP server cannot be reached or initialized
+        """
+        ready = asyncio.get_running_loop().create_future()
+        self._closing = asyncio.Event()
+        self._owner = asyncio.create_task(self._hold_session(ready))
+        self.session = await ready
+
+    async def ping(self) -> bool:
+        """
+        Verify MCP server is reachable and responding correctly.
+
+        Connects on first use (or after a failure), then sends a protocol-level
+        ping over the reused session.
+
+        Returns:
+            bool: True if server is healthy, False otherwise
+        """
+        try:
+            if self.session is None:
+                await self.connect()
+            await self.session.send_ping()
+            return True
+        except Exception as e:
+            logger.error("MCP health check failed: %s", e)
+            await self.close()
+            return False
+
+    async def close(self) -> None:
+        """
+        Close the MCP session and transport, if open.
+        """
+        owner, self._owner = self._owner, None
+        self.session = None
+        if owner is not None:
+            self._closing.set()
+            try:
+                await owner
+            except Exception as e:
+                logger.warning("Error closing MCP health probe: %s", e)
+
+
+# Last result of each /health probe, shared by callers within HEALTH_CHECK_TTL
+_health_cache: dict[str, dict] = {}
+
+
+async def cached_health_check(name: str, check: Callable[[], Awaitable[bool]]) -> bool:
+    """
+    Return a health probe result, running the probe at most once per TTL.
+
+    Frequent monitors and orchestrator probes reuse the last result instead of
+    probing each time. Concurrent callers wait on a per-probe lock so only one
+    probe is in flight, even while the dependency is down.
 
     Args:
-        mcp_server_url: URL of the MCP server to check
+        name: Cache key identifying the probe
+        check: Coroutine function performing the probe
 
     Returns:
-        bool: True if server is healthy, False otherwise
+        bool: True if the dependency is healthy, False otherwise
 
     Example:
-        >>> await is_mcp_server_healthy("http://localhost:8000/mcp")
+        >>> await cached_health_check("mcp", probe.ping)
         True
+    """
+    cache = _health_cache.get(name)
+    if cache is None:
+        cache = _health_cache[name] = {
+            "ts": float("-inf"),
+            "ok": False,
+            "lock": asyncio.Lock(),
+        }
+    if time.monotonic() - cache["ts"] < HEALTH_CHECK_TTL:
+        return cache["ok"]
+
+    async with cache["lock"]:
+        # Another caller may have refreshed the result while we waited
+        if time.monotonic() - cache["ts"] < HEALTH_CHECK_TTL:
+            return cache["ok"]
+        cache["ok"] = await check()
+        cache["ts"] = time.monotonic()
+        return cache["ok"]
+
+
+async def is_twilio_reachable(http: httpx.AsyncClient) -> bool:
+    """
+    Verify the Twilio REST API is reachable with the configured credentials.
 
-    Note:
-        Returns False if connection fails or health check returns non-ok status.
+    Args:
+        http: Shared Twilio HTTP client
+
+    Returns:
+        bool: True if the account lookup succeeds, False otherwise
     """
     try:
-        async with streamablehttp_client(mcp_server_url) as (
-            read_stream,
-            write_stream,
-            _,
-        ):
-            async with ClientSession(read_stream, write_stream) as session:
-                await session.initialize()
-                result = await session.call_tool("is_healthy", {})
-                return result.get("status") == "ok"
+        response = await http.get(f"/2010-04-01/Accounts/{TWILIO_ACCOUNT_SID}.json")
+        response.raise_for_status()
+        return True
     except Exception as e:
-        logger.error(f"MCP health check failed: {e}")
+        logger.error("Twilio health check failed: %s", e)
         return False
 
 
@@ -389,6 +936,9 @@ def check_missing_env_vars() -> tuple[list[str], bool]:
     """
     Validate that all required environment variables are set.
 
+    Reports the snapshot taken at import rather than re-reading the
+    environment on every call.
+
     Returns:
         Tuple containing:
             - List of missing environment variable names
@@ -400,15 +950,7 @@ def check_missing_env_vars() -> tuple[list[str], bool]:
         ...     print(f"Missing: {missing}")
         Missing: ['GROQ_API_KEY']
     """
-    required_env_vars = [
-        "TWILIO_ACCOUNT_SID",
-        "TWILIO_AUTH_TOKEN",
-        "TWILIO_WHATSAPP_NUMBER",
-        "GOOGLE_API_KEY",
-    ]
-    missing_env_vars = [var for var in required_env_vars if not os.environ.get(var)]
-    env_ok = not missing_env_vars
-    return missing_env_vars, env_ok
+    return list(MISSING_ENV_VARS), not MISSING_ENV_VARS
 
 
 async def process_message_task(
@@ -417,18 +959,17 @@ async def process_message_task(
     message: str,
     message_sid: str,
     session_manager: SessionManager,
-    rate_limiter: RateLimiter,
-    num_media: int,
+    http: httpx.AsyncClient,
 ) -> None:
     """
     Background task for processing WhatsApp messages asynchronously.
 
     This function runs as a FastAPI background task, allowing the webhook
     endpoint to return immediately to Twilio while message processing continues.
-    Handles the complete message lifecycle including:
-    - Typing indicator
-    - Media validation
-    - Rate limit checking
+    Media and rate-limit rejections are answered by the webhook itself, so
+    this only runs for accepted messages. Handles:
+    - Typing indicator (sent concurrently with agent processing)
+    - Answering messages queued while this one was processed
     - Agent processing
     - Response delivery
     - Error handling
@@ -438,13 +979,13 @@ async def process_message_task(
         phone_number: User's phone number (E.164 format without whatsapp: prefix)
         message: The message text from the user
         message_sid: Twilio message identifier for typing indicator
-        session_manager: Session manager to update processing state
-        rate_limiter: Rate limiter to check message limits
-        num_media: Number of media attachments (0 for text-only)
+        session_manager: Session manager holding the processing state; the
+            caller must have called start_processing for phone_number
+        http: Shared Twilio HTTP client
 
     Side Effects:
-        - Sends typing indicator via Twilio
-        - Sends WhatsApp response message
+        - Sends typing indicator via Twilio (debounced per user)
+        - Sends WhatsApp response message (in the background, with retries)
         - Updates session manager processing state
         - Reports errors to Rollbar
         - Logs processing events
@@ -452,92 +993,123 @@ async def process_message_task(
     Example:
         >>> background_tasks.add_task(
         ...     process_message_task,
-        ...     agent, "+1234567890", "Hello", "SM123", manager, limiter, 0
+        ...     agent, "+1234567890", "Hello", "SM123", manager, http
         ... )
     """
     try:
-        # Mark as processing to prevent concurrent handling
-        session_manager.start_processing(phone_number)
-
-        # Send typing indicator for better UX
-        await send_typing_indicator_safe(message_sid)
-
-        # Determine response based on validation and processing
-        response_text = await determine_response(
-            agent, phone_number, message, num_media, rate_limiter
-        )
+        while True:
+            # Send typing indicator for better UX without delaying the agent,
+            # unless one sent moments ago is still showing
+            if session_manager.should_send_typing(phone_number):
+                run_in_background(send_typing_indicator_safe(http, message_sid))
+
+            # Process the message
+            response_text = await process_with_agent(agent, message, phone_number)
+
+            # Deliver the reply in the background so queued messages can start
+            # processing without waiting on the Twilio round-trip
+            run_in_background(
+                send_whatsapp_message_safe(http, phone_number, response_text)
+            )
 
-        # Send WhatsApp reply
-        await send_whatsapp_message(phone_number, response_text)
+            # Answer anything the user sent meanwhile as a single follow-up turn
+            pending = session_manager.take_pending(phone_number)
+            if pending is None:
+                break
+            message, message_sid = pending
 
     finally:
         # Always mark as finished, even on error
         session_manager.finish_processing(phone_number)
 
 
-async def send_typing_indicator_safe(message_sid: str) -> None:
+async def send_typing_indicator_safe(http: httpx.AsyncClient, message_sid: str) -> None:
     """
     Send WhatsApp typing indicator with error handling.
 
     Args:
+        http: Shared Twilio HTTP client
         message_sid: Twilio message identifier
 
     Side Effects:
         Logs warning if typing indicator fails
     """
     try:
-        send_typing_indicator(
-            message_sid,
-            account_sid=TWILIO_ACCOUNT_SID,
-            auth_token=TWILIO_AUTH_TOKEN,
-        )
+        await send_typing_indicator_async(http, message_sid)
     except Exception as e:
-        logger.warning(f"Typing indicator failed: {e}")
+        logger.warning("Typing indicator failed: %s", e)
 
 
-async def determine_response(
-    agent: AskariAgent,
-    phone_number: str,
-    message: str,
-    num_media: int,
-    rate_limiter: RateLimiter,
-) -> str:
+def get_rejection_message(
+    phone_number: str, num_media: int, rate_limiter: RateLimiter
+) -> str | None:
     """
-    Determine the appropriate response based on validation and processing.
+    Run the cheap validation checks for an incoming message.
 
     Applies validation rules in order:
     1. Check for media attachments (not supported)
     2. Check rate limits
-    3. Process message with agent
 
     Args:
-        agent: The AskariAgent instance
         phone_number: User's phone number
-        message: The message text
         num_media: Number of media attachments
         rate_limiter: Rate limiter instance
 
     Returns:
-        str: The response text to send to the user
+        str | None: The rejection text to send to the user, or None if the
+        message should be processed
 
     Example:
-        >>> response = await determine_response(agent, "+1234567890", "Hello", 0, limiter)
-        >>> print(response)
-        "Hello! How can I help you?"
+        >>> get_rejection_message("+1234567890", 1, limiter)
+        "⚠️ Sorry, I can only process text messages. ..."
     """
     # Check for media attachments
     if num_media > 0:
-        logger.info(f"Rejected media message from {phone_number}")
+        logger.info("Rejected media message from %s", phone_number)
         return MSG_MEDIA_NOT_SUPPORTED
 
     # Check rate limit
     if rate_limiter.is_rate_limited(phone_number):
         remaining_time = rate_limiter.get_remaining_time(phone_number)
-        logger.warning(f"Rate limit exceeded for {phone_number}")
+        logger.warning("Rate limit exceeded for %s", phone_number)
         return MSG_RATE_LIMITED.format(remaining_time)
 
-    # Process the message
-    return await process_with_agent(agent, message, phone_number)
+    return None
+
+
+class TwimlAckResponse(Response):
+    """
+    Empty TwiML acknowledgement returned for accepted webhook messages.
+
+    The body and encoded headers never change, so they are built once at
+    import; each instance only carries its own background tasks.
+    """
+
+    media_type = "application/xml"
+    _raw_headers = PlainTextResponse("", media_type="application/xml").raw_headers
+
+    def __init__(self) -> None:
+        self.status_code = 200
+        self.body = b""
+        self.background = None
+        self.raw_headers = list(self._raw_headers)
+
+
+def twiml_reply(message_text: str) -> PlainTextResponse:
+    """
+    Build a webhook response that makes Twilio deliver a reply itself.
+
+    Replying inline via TwiML avoids a separate outbound Messages API call.
+
+    Args:
+        message_text: Reply to send to the user
+
+    Returns:
+        PlainTextResponse: TwiML document containing the reply
+    """
+    twiml = MessagingResponse()
+    twiml.message(message_text)
+    return PlainTextResponse(str(twiml), media_type="application/xml")
 
 
 async def process_with_agent(
@@ -561,19 +1133,56 @@ async def process_with_agent(
     try:
         return await agent.run(message)
     except AuthenticationError:
-        logger.info(f"Authentication required for {phone_number}")
+        logger.info("Authentication required for %s", phone_number)
         return MSG_AUTH_REQUIRED
     except Exception as e:
-        logger.error(f"Agent processing error for {phone_number}: {e}")
+        logger.error("Agent processing error for %s: %s", phone_number, e)
         await report_error_to_rollbar_async(exc=e)
         return MSG_PROCESSING_ERROR
 
 
-async def send_whatsapp_message(phone_number: str, message_text: str) -> None:
+async def twilio_send(http: httpx.AsyncClient, to: str, body: str) -> None:
+    """
+    Send a single WhatsApp message through the Twilio Messages REST API.
+
+    Args:
+        http: Shared Twilio HTTP client
+        to: Recipient address (format: whatsapp:+1234567890)
+        body: Message body, at most WHATSAPP_MESSAGE_LIMIT characters
+
+    Transient failures (network errors, 429 and 5xx responses) are retried
+    up to SEND_ATTEMPTS times with exponential backoff.
+
+    Raises:
+        httpx.HTTPError: If Twilio rejects the message or every attempt fails
+    """
+    for attempt in range(1, SEND_ATTEMPTS + 1):
+        try:
+            async with _outbound_semaphore:
+                response = await http.post(
+                    TWILIO_MESSAGES_PATH,
+                    data={"From": FROM_WHATSAPP, "To": to, "Body": body},
+                )
+            response.raise_for_status()
+            return
+        except httpx.HTTPStatusError as e:
+            status = e.response.status_code
+            if attempt == SEND_ATTEMPTS or (status != 429 and status < 500):
+                raise
+        except httpx.TransportError:
+            if attempt == SEND_ATTEMPTS:
+                raise
+        await asyncio.sleep(SEND_RETRY_BACKOFF * 2 ** (attempt - 1))
+
+
+async def send_whatsapp_message(
+    http: httpx.AsyncClient, phone_number: str, message_text: str
+) -> None:
     """
     Send a WhatsApp message via Twilio.
 
     Args:
+        http: Shared Twilio HTTP client
         phone_number: Recipient's phone number (E.164 format without prefix)
         message_text: Message content to send
 
@@ -582,24 +1191,49 @@ async def send_whatsapp_message(phone_number: str, message_text: str) -> None:
         - Logs message delivery
 
     Example:
-        >>> await send_whatsapp_message("+1234567890", "Hello!")
+        >>> await send_whatsapp_message(http, "+1234567890", "Hello!")
     """
+    to = f"whatsapp:{phone_number}"
     formatted_message = convert_markdown_to_whatsapp(message_text)
-    chunks = split_whatsapp_message(formatted_message)
+    # Most replies fit in one message; only run the splitter on overflow
+    if len(formatted_message) <= WHATSAPP_MESSAGE_LIMIT:
+        chunks = [formatted_message]
+    else:
+        chunks = split_whatsapp_message(formatted_message)
 
     for i, chunk in enumerate(chunks):
         try:
-            twilio_client.messages.create(
-                from_=f"whatsapp:{TWILIO_WHATSAPP_NUMBER}",
-                body=chunk,
-                to=f"whatsapp:{phone_number}",
+            await twilio_send(http, to, chunk)
+            logger.info(
+                "Sent response to %s (chunk %s/%s)", phone_number, i + 1, len(chunks)
             )
-            logger.info(f"Sent response to {phone_number} (chunk {i+1}/{len(chunks)})")
         except Exception as e:
-            logger.error(f"Failed to send chunk {i+1} to {phone_number}: {e}")
+            logger.error("Failed to send chunk %s to %s: %s", i + 1, phone_number, e)
             raise e
 
 
+async def send_whatsapp_message_safe(
+    http: httpx.AsyncClient, phone_number: str, message_text: str
+) -> None:
+    """
+    Send a WhatsApp message, reporting failures instead of raising.
+
+    Used for fire-and-forget delivery where no caller awaits the result.
+
+    Args:
+        http: Shared Twilio HTTP client
+        phone_number: Recipient's phone number (E.164 format without prefix)
+        message_text: Message content to send
+
+    Side Effects:
+        Reports delivery failures to Rollbar
+    """
+    try:
+        await send_whatsapp_message(http, phone_number, message_text)
+    except Exception as e:
+        await report_error_to_rollbar_async(exc=e)
+
+
 def create_app() -> FastAPI:
     """
     Create and configure the FastAPI application.
@@ -615,9 +1249,12 @@ def create_app() -> FastAPI:
         >>> app = create_app()
         >>> # Use with uvicorn or gunicorn
     """
+    warm_pool = MCPWarmPool(MCP_SERVER_URL, size=MCP_WARM_POOL_SIZE)
+
     session_manager = SessionManager(
         mcp_server_url=MCP_SERVER_URL,
         instructions=WHATSAPP_SYSTEM_PROMPT,
+        warm_pool=warm_pool,
     )
 
     rate_limiter = RateLimiter(
@@ -625,21 +1262,48 @@ def create_app() -> FastAPI:
         window_seconds=RATE_LIMIT_WINDOW,
     )
 
+    async def sweep_periodically() -> None:
+        """
+        Periodically release expired rate-limit buckets and idle sessions.
+        """
+        while True:
+            await asyncio.sleep(SWEEP_INTERVAL)
+            try:
+                rate_limiter.sweep()
+                await session_manager.sweep_idle()
+            except Exception as e:
+                logger.error("Session sweep failed: %s", e)
+
     @asynccontextmanager
     async def lifespan(app: FastAPI):
         """
         Application lifespan manager for graceful startup/shutdown.
 
-        Ensures all MCP connections are properly closed when the server stops.
+        Opens the shared Twilio HTTP client and MCP health probe, starts
+        warming MCP connections and the idle-session sweeper on startup, and
+        ensures they and all MCP connections are properly closed when the
+        server stops.
         """
+        app.state.http = create_twilio_http_client()
+        app.state.health_probe = HealthProbe(MCP_SERVER_URL)
+        warm_pool.refill()
+        sweeper = asyncio.create_task(sweep_periodically())
         yield
+        sweeper.cancel()
+        await warm_pool.close()
         await session_manager.close_all()
+        await app.state.health_probe.close()
+        await app.state.http.aclose()
 
     # Initialize Rollbar for error tracking
     is_rollbar_initialized = initialize_rollbar()
 
     # Create FastAPI app
-    app = FastAPI(title="Askari WhatsApp Bot", lifespan=lifespan)
+    app = FastAPI(
+        title="Askari WhatsApp Bot",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     if is_rollbar_initialized:
         rollbar_add_to(app)
@@ -655,9 +1319,11 @@ def create_app() -> FastAPI:
         """
         Twilio webhook endpoint for incoming WhatsApp messages.
 
-        Receives WhatsApp messages from Twilio, validates concurrent processing,
-        retrieves or creates agent session, and queues message processing as
-        a background task.
+        Receives WhatsApp messages from Twilio and rejects media and
+        rate-limited messages inline via TwiML. Accepted messages are queued
+        behind any one already being processed for the sender; otherwise the
+        agent session is retrieved or created and processing starts as a
+        background task.
 
         Args:
             background_tasks: FastAPI background task manager
@@ -667,10 +1333,11 @@ def create_app() -> FastAPI:
             NumMedia: Number of media attachments (default: 0)
 
         Returns:
-            PlainTextResponse: Empty XML response (Twilio requirement)
+            PlainTextResponse | TwimlAckResponse: TwiML rejection reply, or an
+            empty XML response (Twilio requirement) when the message is accepted
 
         Side Effects:
-            - Sends "processing previous message" warning if concurrent
+            - Queues the message if one is already being processed
             - Creates/retrieves agent session
             - Queues background processing task
 
@@ -681,16 +1348,30 @@ def create_app() -> FastAPI:
             # MessageSid: SM123
             # -> Responds immediately, processes in background
         """
-        phone_number = From.replace("whatsapp:", "")
+        phone_number = From.removeprefix("whatsapp:")
 
-        # Check for concurrent message processing
+        # Reject unsupported or rate-limited messages in the webhook response
+        # itself, skipping the typing indicator and outbound send entirely
+        rejection = get_rejection_message(phone_number, NumMedia, rate_limiter)
+        if rejection is not None:
+            return twiml_reply(rejection)
+
+        # Queue behind a message that is already being processed; the running
+        # task answers it once the current reply has been sent
         if session_manager.is_processing(phone_number):
-            logger.info(f"Message already being processed for {phone_number}")
-            await send_whatsapp_message(phone_number, MSG_PROCESSING_PREVIOUS)
-            return PlainTextResponse("", media_type="application/xml")
+            logger.info("Queued message for %s behind one in progress", phone_number)
+            session_manager.enqueue(phone_number, PendingMessage(Body, MessageSid))
+            return TwimlAckResponse()
+
+        # Claim the phone before awaiting so concurrent webhooks queue behind us
+        session_manager.start_processing(phone_number)
 
         # Retrieve or create persistent agent session
-        agent = await session_manager.get_or_create_session(phone_number)
+        try:
+            agent = await session_manager.get_or_create_session(phone_number)
+        except Exception:
+            session_manager.finish_processing(phone_number)
+            raise
 
         # Queue message processing as background task
         background_tasks.add_task(
@@ -700,12 +1381,11 @@ def create_app() -> FastAPI:
             Body,
             MessageSid,
             session_manager,
-            rate_limiter,
-            NumMedia,
+            app.state.http,
         )
 
         # Respond immediately to Twilio (required within 15 seconds)
-        return PlainTextResponse("", media_type="application/xml")
+        return TwimlAckResponse()
 
     @app.get("/health")
     async def health():
@@ -715,29 +1395,41 @@ def create_app() -> FastAPI:
         Validates:
         - Required environment variables are set
         - MCP server is reachable and healthy
+        - Twilio API is reachable with the configured credentials
+
+        The network probes run concurrently, so latency is that of the
+        slowest probe rather than their sum.
 
         Returns:
-            JSONResponse: Health status with HTTP 200 (healthy) or 503 (unhealthy)
+            ORJSONResponse: Health status with HTTP 200 (healthy) or 503 (unhealthy)
 
         Example:
             >>> response = await client.get("/health")
             >>> response.json()
             {
                 "env_status": "ok",
-                "mcp_server_alive": true
+                "mcp_server_alive": true,
+                "twilio_reachable": true
             }
         """
         missing_env_vars, env_ok = check_missing_env_vars()
-        mcp_ok = await is_mcp_server_healthy(MCP_SERVER_URL)
+        mcp_ok, twilio_ok = await asyncio.gather(
+            cached_health_check("mcp", app.state.health_probe.ping),
+            cached_health_check("twilio", lambda: is_twilio_reachable(app.state.http)),
+            return_exceptions=True,
+        )
+        # A probe that raised counts as unhealthy
+        mcp_ok, twilio_ok = mcp_ok is True, twilio_ok is True
 
-        status_code = 200 if env_ok and mcp_ok else 503
+        status_code = 200 if env_ok and mcp_ok and twilio_ok else 503
 
-        return JSONResponse(
+        return ORJSONResponse(
             {
                 "env_status": "ok"
                 if env_ok
                 else f"missing: {', '.join(missing_env_vars)}",
                 "mcp_server_alive": mcp_ok,
+                "twilio_reachable": twilio_ok,
             },
             status_code=status_code,
         )
@@ -762,8 +1454,16 @@ def main():
     """
     Entry point for running the server directly.
 
-    Starts Uvicorn server on all interfaces (0.0.0.0) port 8001.
-    For production, use Gunicorn with Uvicorn workers instead.
+    Starts Uvicorn server on all interfaces (0.0.0.0) port 8001 using the
+    httptools parser and the uvloop event loop (asyncio where uvloop is not
+    installed, e.g. on Windows), with WEB_CONCURRENCY worker processes. For
+    production, use Gunicorn with Uvicorn workers instead (UvicornWorker also
+    picks uvloop automatically when installed).
+
+    Note:
+        Sessions, rate limits and queued follow-up messages live in process
+        memory, so with more than one worker each worker keeps its own; a
+        user's messages may be spread across workers.
 
     Example:
         $ python -m askari_patrol_client.server
@@ -772,8 +1472,19 @@ def main():
     """
     import uvicorn
 
-    app = create_app()
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # Workers need an import string; the factory builds one app per worker
+    uvicorn.run(
+        "askari_patrol_client.whatsapp_client:create_app",
+        factory=True,
+        host="0.0.0.0",
+        port=8001,
+        # uvloop when importable, asyncio otherwise
+        loop="auto",
+        http="httptools",
+        backlog=2048,
+        timeout_keep_alive=30,
+        workers=WEB_CONCURRENCY,
+    )
 
 
 if __name__ == "__main__":
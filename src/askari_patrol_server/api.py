@@ -6,22 +6,128 @@ Askari Patrol guard tour management system API. It handles authentication,
 site management, patrol tracking, and notification retrieval.
 """
 
-from collections.abc import AsyncIterator
+import asyncio
+import functools
+import logging
+import math
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Awaitable, Callable
+from datetime import date
+from itertools import chain
+from typing import Any
 
 import httpx
+import orjson
 from common.schemas.response_schemas import (
+    GetAllSitePatrolsResponse,
     GetGuardPatrolsResponse,
     GetGuardPerformanceReportResponse,
     GetGuardsResponse,
     GetSiteCallLogsResponse,
     GetSiteGuardsResponse,
     GetSiteNotificationsResponse,
+    GetSiteOverviewResponse,
     GetSitePatrolsResponse,
     GetSiteShiftsResponse,
     GetSitesResponse,
     LoginResponse,
 )
-from common.utils import is_token_valid
+from common.utils import decode_token_payload
+
+logger = logging.getLogger(__name__)
+
+# Seconds a cached GET response stays fresh. Listings change during the day,
+# shift rosters rarely do. A month's score keeps changing until the month
+# closes, after which it is historical.
+LIST_CACHE_TTL = 30.0
+SHIFTS_CACHE_TTL = 60.0
+SCORE_CACHE_TTL = 300.0
+CLOSED_MONTH_SCORE_CACHE_TTL = 3600.0
+CACHE_MAX_ENTRIES = 256
+
+# Page cap for get_all_site_patrols (10 patrols per page), so an unbounded
+# date range neither floods the model's context nor the upstream API
+ALL_PATROLS_MAX_PAGES = 10
+
+
+def _is_upstream_failure(exc: Exception) -> bool:
+    """Whether exc means the API was unreachable or failed (not a client error)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
+
+
+def _json(resp: httpx.Response) -> Any:
+    """Decode a JSON response body with orjson (faster than stdlib on large pages)."""
+    return orjson.loads(resp.content)
+
+
+def _token_expiry(token: str, payload: dict[str, Any] | None = None) -> float:
+    """
+    Return a JWT's ``exp`` claim as a Unix timestamp.
+
+    Tokens without an ``exp`` claim never expire; tokens that cannot be
+    decoded, or whose ``exp`` is not numeric, are treated as already expired.
+
+    Args:
+        token: The encoded JWT string.
+        payload: The token's already-decoded payload, if the caller has it.
+
+    Returns:
+        float: The expiry time, ``math.inf`` or ``0.0``.
+    """
+    if payload is None:
+        payload = decode_token_payload(token)
+    if payload is None:
+        return 0.0
+    exp = payload.get("exp")
+    if exp is None:
+        return math.inf
+    try:
+        return float(exp)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+# Prebuilt query strings for the common unfiltered pages
+_PAGE_QS = {i: f"?page={i}" for i in range(1, 51)}
+
+
+def _page_qs(page: int | None) -> str:
+    """Return the "?page=N" query string for page, or "" when page is None."""
+    if page is None:
+        return ""
+    return _PAGE_QS.get(page) or f"?page={page}"
+
+
+# NestJS pagination filter operators keyed by (has_start, has_end)
+_RANGE_TMPL = {
+    (True, True): "$btw:{0},{1}",
+    (True, False): "$gte:{0}",
+    (False, True): "$lte:{1}",
+}
+
+
+def _build_range_filter(start: str | None, end: str | None) -> str | None:
+    """
+    Build a NestJS range filter value from optional bounds.
+
+    Args:
+        start: Inclusive lower bound, or None.
+        end: Inclusive upper bound, or None.
+
+    Returns:
+        str | None: e.g. "$btw:start,end", "$gte:start" or "$lte:end";
+            None when neither bound is given.
+    """
+    tmpl = _RANGE_TMPL.get((bool(start), bool(end)))
+    return tmpl.format(start, end) if tmpl else None
+
+
+# Loading the CA bundle takes tens of milliseconds, so build the TLS context
+# once (before any worker fork) and share it between per-session clients.
+_SSL_CONTEXT = httpx.create_ssl_context()
 
 
 class AskariPatrolAsyncClient(httpx.AsyncClient):
@@ -33,25 +139,57 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
     """
 
     _BASE_URL = "https://guardtour.legitsystemsug.com"
+    # Keep every pooled connection alive so fan-out bursts (e.g. the site
+    # overview) reuse warm connections rather than opening new ones
+    _LIMITS = httpx.Limits(
+        max_connections=32, max_keepalive_connections=32, keepalive_expiry=120.0
+    )
 
     def __init__(self):
-        """Initialize the client with base URL and default timeout."""
-        super().__init__(base_url=self._BASE_URL, timeout=30.0)
+        """Initialize the client with base URL, default timeout and HTTP/2."""
+        # HTTP/2 lets concurrent requests (e.g. get_site_overview) share one
+        # connection instead of queueing for pooled HTTP/1.1 connections
+        # Accept-Encoding defaults to gzip/deflate, plus br via httpx[brotli]
+        # Connection failures (never sent requests) are retried by the transport
+        transport = httpx.AsyncHTTPTransport(
+            verify=_SSL_CONTEXT, http2=True, limits=self._LIMITS, retries=2
+        )
+        super().__init__(base_url=self._BASE_URL, timeout=30.0, transport=transport)
         self._token: str | None = None
-
-    def _set_auth_header(self, token: str):
+        # Unix expiry of _token, decoded once when the token is set
+        self._token_exp: float = 0.0
+        # (path, params) -> (expires_at, value) for idempotent GETs, least
+        # recently used first
+        self._cache: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        # key -> task for GETs currently in flight, shared by duplicate callers
+        self._inflight: dict[tuple, asyncio.Task] = {}
+        # Bumped on every token change so fetches started under an earlier
+        # token do not write into the cache of the next one
+        self._auth_generation = 0
+
+    def _set_auth_header(self, token: str, payload: dict[str, Any] | None = None):
         """
         Update client headers with the provided JWT bearer token.
 
         Args:
             token: The access token string.
+            payload: The token's decoded payload, if already known, so it
+                is not decoded again to read the expiry.
         """
         self._token = token
+        self._token_exp = _token_expiry(token, payload)
+        self._auth_generation += 1
+        self._cache.clear()
+        self._inflight.clear()
         self.headers.update({"Authorization": f"Bearer {token}"})
 
     async def logout(self):
-        """Clear the current session token."""
+        """Clear the current session token and any responses cached under it."""
         self._token = None
+        self._token_exp = 0.0
+        self._auth_generation += 1
+        self._cache.clear()
+        self._inflight.clear()
         if "Authorization" in self.headers:
             del self.headers["Authorization"]
 
@@ -71,10 +209,146 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
             json={"username": username, "password": password},
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json(resp)
         self._set_auth_header(data["access_token"])
         return data
 
+    async def _get_public(self, path: str, params: dict | None = None) -> Any:
+        """
+        GET a public endpoint without sending the bearer token.
+
+        The request goes through this client's own connection pool; only the
+        Authorization header is dropped from the built request.
+
+        Args:
+            path: Endpoint path relative to the base URL.
+            params: Optional query parameters.
+
+        Returns:
+            Any: The decoded JSON body.
+        """
+        request = self.build_request("GET", path, params=params)
+        request.headers.pop("Authorization", None)
+        resp = await self.send(request)
+        resp.raise_for_status()
+        return _json(resp)
+
+    async def _cached(
+        self, key: tuple, ttl: float, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Return a fresh cached value for key, or await fetch() and cache it.
+
+        Expired entries are kept so that, if the API is down or returns a
+        server error, the last known value is served instead of failing.
+        A value fetched while the token changed is returned to its caller
+        but not cached, and no stale value from the old token is served.
+
+        Args:
+            key: Cache key, typically (path, sorted params).
+            ttl: Seconds the fetched value stays fresh.
+            fetch: Factory for the coroutine that performs the request.
+
+        Returns:
+            Any: The cached, freshly fetched, or (on upstream failure) stale value.
+        """
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and hit[0] > now:
+            self._cache.move_to_end(key)
+            return hit[1]
+
+        generation = self._auth_generation
+        try:
+            value = await self._singleflight(key, fetch)
+        except Exception as e:
+            if (
+                hit is None
+                or generation != self._auth_generation
+                or not _is_upstream_failure(e)
+            ):
+                raise
+            logger.warning("Serving stale %s after upstream error: %s", key[0], e)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            return hit[1]
+
+        if generation != self._auth_generation:
+            return value
+        if key not in self._cache and len(self._cache) >= CACHE_MAX_ENTRIES:
+            self._evict_one(time.monotonic())
+        self._cache[key] = (now + ttl, value)
+        self._cache.move_to_end(key)
+        return value
+
+    def _evict_one(self, now: float) -> None:
+        """
+        Drop one cache entry to make room for a new key.
+
+        The least recently used expired entry goes first, so fresh entries
+        are only evicted (least recently used first) when none has expired.
+
+        Args:
+            now: Current ``time.monotonic()`` reading.
+        """
+        for key, (expires_at, _) in self._cache.items():
+            if expires_at <= now:
+                del self._cache[key]
+                return
+        self._cache.popitem(last=False)
+
+    async def _singleflight(
+        self, key: tuple, fetch: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Run fetch() once for concurrent callers that share the same key.
+
+        The first caller starts the request; callers arriving while it is in
+        flight await the same task instead of issuing a duplicate request.
+
+        Args:
+            key: Identity of the request, typically (path, sorted params).
+            fetch: Factory for the coroutine that performs the request.
+
+        Returns:
+            Any: The result of the shared request.
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+
+            def forget(done: asyncio.Task) -> None:
+                if self._inflight.get(key) is done:
+                    del self._inflight[key]
+
+            task.add_done_callback(forget)
+        # Shield so one caller being cancelled does not cancel the others
+        return await asyncio.shield(task)
+
+    async def _cached_get_json(
+        self, path: str, params: dict | None = None, ttl: float = LIST_CACHE_TTL
+    ) -> Any:
+        """
+        GET an authenticated JSON endpoint through the response cache.
+
+        Args:
+            path: Endpoint path relative to the base URL.
+            params: Optional query parameters.
+            ttl: Seconds the response stays fresh.
+
+        Returns:
+            Any: The decoded JSON body.
+        """
+
+        async def fetch():
+            resp = await self.get(path, params=params)
+            resp.raise_for_status()
+            return _json(resp)
+
+        key = (path, tuple(sorted((params or {}).items())))
+        return await self._cached(key, ttl, fetch)
+
     async def _search_all_pages(self, endpoint: str, query: str) -> AsyncIterator[dict]:
         """
         Helper to fetch all matching records across all pagination pages for a search.
@@ -92,7 +366,7 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
                 endpoint, params={"search": query, "page": current_page}
             )
             resp.raise_for_status()
-            batch = resp.json()
+            batch = _json(resp)
 
             for item in batch.get("data", []):
                 yield item
@@ -129,12 +403,9 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         Returns:
             GetSitesResponse: Paginated list of sites.
         """
-        params = {"page": page}
-        if query:
-            params["search"] = query
-        resp = await self.get("/sites", params=params)
-        resp.raise_for_status()
-        return resp.json()
+        if not query:
+            return await self._cached_get_json(f"/sites{_page_qs(page)}")
+        return await self._cached_get_json("/sites", {"page": page, "search": query})
 
     async def get_site_shifts(self, site_id: int) -> GetSiteShiftsResponse:
         """
@@ -146,9 +417,9 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         Returns:
             GetSiteShiftsResponse: List of shift objects.
         """
-        resp = await self.get(f"/sites/{site_id}/shifts")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._cached_get_json(
+            f"/sites/{site_id}/shifts", ttl=SHIFTS_CACHE_TTL
+        )
 
     async def get_site_guards(self, site_id: int) -> GetSiteGuardsResponse:
         """
@@ -161,10 +432,7 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
             GetSiteGuardsResponse: Aggregated list of guards from all site shifts.
         """
         site_shifts = await self.get_site_shifts(site_id)
-        guards = []
-        for shift in site_shifts:
-            guards.extend(shift["securityGuards"])
-        return guards
+        return list(chain.from_iterable(s["securityGuards"] for s in site_shifts))
 
     async def get_site_call_logs(
         self, site_id: int, page: int | None = 1
@@ -179,9 +447,9 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         Returns:
             GetSiteCallLogsResponse: List of recorded calls for the site.
         """
-        resp = await self.get(f"/sites/{site_id}/call-logs", params={"page": page})
-        resp.raise_for_status()
-        return resp.json()
+        return await self._cached_get_json(
+            f"/sites/{site_id}/call-logs{_page_qs(page)}"
+        )
 
     async def get_site_patrols(
         self,
@@ -211,29 +479,127 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         params = {"page": page}
 
         # Build date filters
-        if start_date and end_date:
-            params["filter.date"] = f"$btw:{start_date},{end_date}"
-        elif start_date:
-            params["filter.date"] = f"$gte:{start_date}"
-        elif end_date:
-            params["filter.date"] = f"$lte:{end_date}"
+        if date_filter := _build_range_filter(start_date, end_date):
+            params["filter.date"] = date_filter
 
         # Build time filters
-        if start_time and end_time:
-            params["filter.startTime"] = f"$btw:{start_time},{end_time}"
-        elif start_time:
-            params["filter.startTime"] = f"$gte:{start_time}"
-        elif end_time:
-            params["filter.startTime"] = f"$lte:{end_time}"
-
-        # Use a fresh client to bypass authenticated session for public patrol endpoints
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(
-                f"{self._BASE_URL}/sites/{site_id}/patrols",
-                params=params,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        if time_filter := _build_range_filter(start_time, end_time):
+            params["filter.startTime"] = time_filter
+
+        # Public endpoint: avoid sending the bearer token
+        return await self._get_public(f"/sites/{site_id}/patrols", params)
+
+    async def get_all_site_patrols(
+        self,
+        site_id: int,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        start_time: str | None = None,
+        end_time: str | None = None,
+        max_pages: int = ALL_PATROLS_MAX_PAGES,
+        max_concurrency: int = 8,
+    ) -> GetAllSitePatrolsResponse:
+        """
+        Retrieve a site's patrol records across result pages, up to max_pages.
+
+        The first page is fetched to learn the page count; the remaining pages
+        are then requested concurrently (at most ``max_concurrency`` at a time)
+        instead of one after another. Pages past ``max_pages`` are not fetched
+        and the result is marked as truncated.
+
+        Args:
+            site_id: Database ID of the site.
+            start_date: Start date for filtering (YYYY-MM-DD).
+            end_date: End date for filtering (YYYY-MM-DD).
+            start_time: Start time for filtering (HH:MM).
+            end_time: End time for filtering (HH:MM).
+            max_pages: Maximum number of result pages to fetch.
+            max_concurrency: Maximum number of page requests in flight.
+
+        Returns:
+            GetAllSitePatrolsResponse: The fetched patrols in page order, the
+            total number of matching patrols and whether any were left out.
+        """
+        fetch_page = functools.partial(
+            self.get_site_patrols,
+            site_id,
+            start_date=start_date,
+            end_date=end_date,
+            start_time=start_time,
+            end_time=end_time,
+        )
+        first = await fetch_page(page=1)
+        meta = first.get("meta", {})
+        total_pages = meta.get("totalPages", 0)
+        last_page = min(total_pages, max_pages)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(page: int) -> dict:
+            async with semaphore:
+                return await fetch_page(page=page)
+
+        pages = [first]
+        pages += await asyncio.gather(*(fetch(p) for p in range(2, last_page + 1)))
+        data = list(chain.from_iterable(p.get("data", []) for p in pages))
+        return {
+            "data": data,
+            "totalItems": meta.get("totalItems", len(data)),
+            "truncated": total_pages > last_page,
+        }
+
+    async def get_site_overview(
+        self,
+        site_id: int,
+        page: int | None = 1,
+        year: int | None = None,
+        month: int | None = None,
+    ) -> GetSiteOverviewResponse:
+        """
+        Retrieve a site's shifts, call logs, notifications, patrols and
+        monthly score together.
+
+        The requests are independent, so they are issued concurrently and the
+        call takes as long as the slowest one rather than their sum.
+
+        Args:
+            site_id: Database ID of the site.
+            page: Optional page number applied to the paginated sections.
+            year: Year of the monthly score. Defaults to the current year.
+            month: Month of the monthly score (1-12). Defaults to the current
+                month.
+
+        Returns:
+            GetSiteOverviewResponse: One key per section. A section whose request
+                failed is None and its error is listed under "errors".
+
+        Raises:
+            Exception: The first error, if every section failed.
+        """
+        today = date.today()
+        year = year or today.year
+        month = month or today.month
+        sections = {
+            "shifts": self.get_site_shifts(site_id),
+            "call_logs": self.get_site_call_logs(site_id, page),
+            "notifications": self.get_site_notifications(site_id, page=page),
+            "patrols": self.get_site_patrols(site_id, page=page),
+            "monthly_score": self.get_site_monthly_score(site_id, year, month),
+        }
+        results = await asyncio.gather(*sections.values(), return_exceptions=True)
+
+        overview = {"errors": {}}
+        for name, result in zip(sections, results, strict=True):
+            if isinstance(result, Exception):
+                overview[name] = None
+                overview["errors"][name] = str(result)
+            else:
+                overview[name] = result
+
+        # Nothing useful to return (e.g. not authenticated); surface the error
+        if len(overview["errors"]) == len(sections):
+            raise results[0]
+        return overview
 
     async def get_site_monthly_score(self, site_id: int, year: int, month: int) -> str:
         """
@@ -247,13 +613,21 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         Returns:
             str: Raw score text from the API.
         """
-        resp = await self.get(f"/sites/{site_id}/{year}/{month}/performance")
-        resp.raise_for_status()
-        try:
-            # Score is returned as a decimal fraction (e.g. 0.0357... -> 3.57%)
-            return f"{float(resp.text) * 100:.2f}%"
-        except (ValueError, TypeError):
-            return resp.text
+        path = f"/sites/{site_id}/{year}/{month}/performance"
+
+        async def fetch():
+            resp = await self.get(path)
+            resp.raise_for_status()
+            try:
+                # Score is returned as a decimal fraction (e.g. 0.0357... -> 3.57%)
+                return f"{float(resp.text) * 100:.2f}%"
+            except (ValueError, TypeError):
+                return resp.text
+
+        today = date.today()
+        closed = (year, month) < (today.year, today.month)
+        ttl = CLOSED_MONTH_SCORE_CACHE_TTL if closed else SCORE_CACHE_TTL
+        return await self._cached((path,), ttl, fetch)
 
     async def get_site_notifications(
         self,
@@ -274,19 +648,15 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         Returns:
             GetSiteNotificationsResponse: List of alerts for the site.
         """
-        params = {"page": page}
+        path = f"/sites/{site_id}/notifications"
 
         # Map date filters to API-expected field 'dateCreatedAt'
-        if start_date and end_date:
-            params["filter.dateCreatedAt"] = f"$btw:{start_date},{end_date}"
-        elif start_date:
-            params["filter.dateCreatedAt"] = f"$gte:{start_date}"
-        elif end_date:
-            params["filter.dateCreatedAt"] = f"$lte:{end_date}"
-
-        resp = await self.get(f"/sites/{site_id}/notifications", params=params)
-        resp.raise_for_status()
-        return resp.json()
+        date_filter = _build_range_filter(start_date, end_date)
+        if not date_filter:
+            return await self._cached_get_json(f"{path}{_page_qs(page)}")
+
+        params = {"page": page, "filter.dateCreatedAt": date_filter}
+        return await self._cached_get_json(path, params)
 
     async def search_guards(
         self, query: str, page: int | None = 1
@@ -305,7 +675,7 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
             "/users/security-guards", params={"search": query, "page": page}
         )
         resp.raise_for_status()
-        return resp.json()
+        return _json(resp)
 
     async def get_guard_patrols(
         self,
@@ -333,29 +703,17 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
         params = {"page": page}
 
         # Apply date range logic
-        if start_date and end_date:
-            params["filter.date"] = f"$btw:{start_date},{end_date}"
-        elif start_date:
-            params["filter.date"] = f"$gte:{start_date}"
-        elif end_date:
-            params["filter.date"] = f"$lte:{end_date}"
+        if date_filter := _build_range_filter(start_date, end_date):
+            params["filter.date"] = date_filter
 
         # Apply time range logic
-        if start_time and end_time:
-            params["filter.startTime"] = f"$btw:{start_time},{end_time}"
-        elif start_time:
-            params["filter.startTime"] = f"$gte:{start_time}"
-        elif end_time:
-            params["filter.startTime"] = f"$lte:{end_time}"
-
-        # Fresh client to avoid bearer headers on public endpoints
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            resp = await client.get(
-                f"{self._BASE_URL}/users/security-guards/{guard_id}/patrols",
-                params=params,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        if time_filter := _build_range_filter(start_time, end_time):
+            params["filter.startTime"] = time_filter
+
+        # Public endpoint: avoid sending the bearer token
+        return await self._get_public(
+            f"/users/security-guards/{guard_id}/patrols", params
+        )
 
     async def get_guard_performance_report(
         self, guard_id: int, year: int, month: int
@@ -376,7 +734,7 @@ class AskariPatrolAsyncClient(httpx.AsyncClient):
             params={"year": year, "month": month},
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = _json(resp)
 
         if "overallMonthScore" in data:
             try:
@@ -492,4 +850,4 @@ Available Operations:
         Returns:
             bool: True if authenticated, False otherwise.
         """
-        return self._token is not None and is_token_valid(self._token)
+        return self._token is not None and time.time() < self._token_exp
@@ -25,11 +25,34 @@ import os
 from collections.abc import Callable
 
 import rollbar
+from common.rollbar_config import report_error_to_rollbar_async
 
 logger = logging.getLogger(__name__)
 
-# Read at import time so the check is O(1) inside each wrapper invocation.
-ROLLBAR_SERVER_TOKEN = os.environ.get("ROLLBAR_SERVER_TOKEN")
+# Read at import time so each wrapper invocation only tests a module-level bool.
+_ROLLBAR_ENABLED = bool(os.environ.get("ROLLBAR_SERVER_TOKEN"))
+
+# Strong references to in-flight reports so they are not garbage collected
+# before they finish.
+_pending_reports: set[asyncio.Task] = set()
+
+
+def _report_in_background(exc: Exception, extra_data: dict) -> None:
+    """
+    Schedule a Rollbar report without waiting for it.
+
+    The report runs as its own task and posts asynchronously, so the failing
+    tool can re-raise immediately instead of waiting on Rollbar.
+
+    Args:
+        exc: The exception to report.
+        extra_data: Metadata attached to the Rollbar item.
+    """
+    task = asyncio.create_task(
+        report_error_to_rollbar_async(exc, extra_data=extra_data)
+    )
+    _pending_reports.add(task)
+    task.add_done_callback(_pending_reports.discard)
 
 
 def track_errors(tool_name: str = None, log_params: bool = True):
@@ -37,9 +60,10 @@ def track_errors(tool_name: str = None, log_params: bool = True):
     Decorator that reports unhandled tool exceptions to Rollbar.
 
     Attaches metadata (tool name, error type, and sanitised parameters) to
-    each Rollbar report.  If ``ROLLBAR_SERVER_TOKEN`` is not configured the
-    error is logged locally instead and re-raised so FastMCP can return a
-    structured error response to the caller.
+    each Rollbar report and re-raises so FastMCP can return a structured
+    error response to the caller.  If ``ROLLBAR_SERVER_TOKEN`` is not
+    configured the error is logged locally instead, and no parameters are
+    extracted since there is nowhere to report them to.
 
     Args:
         tool_name: Human-readable label for Rollbar reports.
@@ -56,24 +80,24 @@ def track_errors(tool_name: str = None, log_params: bool = True):
     def decorator(func: Callable) -> Callable:
         name = tool_name or func.__name__
 
+        if not _ROLLBAR_ENABLED:
+            return _log_errors(func, name)
+
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             try:
                 return await func(*args, **kwargs)
             except Exception as e:
                 params = _extract_params(args, kwargs, log_params)
-
-                if ROLLBAR_SERVER_TOKEN:
-                    rollbar.report_exc_info(
-                        extra_data={
-                            "tool_name": name,
-                            "error_type": type(e).__name__,
-                            "params": params,
-                        }
-                    )
-                    logger.info("Reported error in '%s' to Rollbar.", name)
-                else:
-                    logger.error("'%s' raised an unhandled error: %s", name, e)
+                _report_in_background(
+                    e,
+                    {
+                        "tool_name": name,
+                        "error_type": type(e).__name__,
+                        "params": params,
+                    },
+                )
+                logger.info("Reporting error in '%s' to Rollbar.", name)
 
                 # Re-raise so FastMCP can translate the exception into a
                 # structured MCP error response for the client.
@@ -85,18 +109,14 @@ def track_errors(tool_name: str = None, log_params: bool = True):
                 return func(*args, **kwargs)
             except Exception as e:
                 params = _extract_params(args, kwargs, log_params)
-
-                if ROLLBAR_SERVER_TOKEN:
-                    rollbar.report_exc_info(
-                        extra_data={
-                            "tool_name": name,
-                            "error_type": type(e).__name__,
-                            "params": params,
-                        }
-                    )
-                    logger.info("Reported error in '%s' to Rollbar.", name)
-                else:
-                    logger.error("'%s' raised an unhandled error: %s", name, e)
+                rollbar.report_exc_info(
+                    extra_data={
+                        "tool_name": name,
+                        "error_type": type(e).__name__,
+                        "params": params,
+                    }
+                )
+                logger.info("Reported error in '%s' to Rollbar.", name)
 
                 raise
 
@@ -105,6 +125,39 @@ def track_errors(tool_name: str = None, log_params: bool = True):
     return decorator
 
 
+def _log_errors(func: Callable, name: str) -> Callable:
+    """
+    Wrap ``func`` so unhandled errors are logged locally and re-raised.
+
+    Used in place of the Rollbar wrappers when reporting is disabled.
+
+    Args:
+        func: The tool function to wrap.
+        name: Label used in the log message.
+
+    Returns:
+        Callable: The wrapped function.
+    """
+
+    @functools.wraps(func)
+    async def async_wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            logger.error("'%s' raised an unhandled error: %s", name, e)
+            raise
+
+    @functools.wraps(func)
+    def sync_wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            logger.error("'%s' raised an unhandled error: %s", name, e)
+            raise
+
+    return async_wrapper if asyncio.iscoroutinefunction(func) else sync_wrapper
+
+
 def _extract_params(args: tuple, kwargs: dict, log_params: bool) -> dict:
     """
     Build a sanitised parameter dict suitable for Rollbar payloads.
@@ -17,29 +17,34 @@ Authentication flow:
        connection.
 """
 
+import os
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from dataclasses import dataclass
 
 from common.rollbar_config import initialize_rollbar
 from common.schemas.response_schemas import (
+    GetAllSitePatrolsResponse,
     GetGuardPatrolsResponse,
     GetGuardPerformanceReportResponse,
     GetGuardsResponse,
     GetSiteCallLogsResponse,
     GetSiteGuardsResponse,
     GetSiteNotificationsResponse,
+    GetSiteOverviewResponse,
     GetSitePatrolsResponse,
     GetSitesResponse,
     LoginResponse,
 )
 from mcp.server.fastmcp import FastMCP
+from mcp.server.lowlevel.server import request_ctx
+from mcp.server.session import ServerSession
 
 from .api import AskariPatrolAsyncClient
 from .decorators.track_errors import track_errors
 
 
-@dataclass
+@dataclass(slots=True)
 class AppContext:
     """Holds application-level state passed through the MCP lifespan."""
 
@@ -52,6 +57,10 @@ async def app_lifespan(server: FastMCP) -> AsyncIterator[AppContext]:
     yield {}
 
 
+# Seconds to let in-flight tool calls finish after SIGTERM/SIGINT before
+# open connections are cut and sessions (and their API clients) are closed.
+GRACEFUL_SHUTDOWN_TIMEOUT = float(os.environ.get("GRACEFUL_SHUTDOWN_TIMEOUT", "30"))
+
 is_rollbar_initialzed = initialize_rollbar()
 
 mcp = FastMCP(
@@ -64,6 +73,19 @@ mcp = FastMCP(
 )
 
 
+def _current_session() -> ServerSession:
+    """
+    Return the MCP session handling the current tool call.
+
+    Reads the request context variable directly rather than going through
+    ``mcp.get_context()``, which builds a new ``Context`` model on every call.
+
+    Returns:
+        ServerSession: The session for the active request.
+    """
+    return request_ctx.get().session
+
+
 def get_client() -> AskariPatrolAsyncClient:
     """
     Return the session-local API client, creating it on first access.
@@ -79,15 +101,15 @@ def get_client() -> AskariPatrolAsyncClient:
     Returns:
         AskariPatrolAsyncClient: The caller's session-scoped HTTP client.
     """
-    ctx = mcp.get_context().request_context
-    session = ctx.session  # unique per chat connection
+    session = _current_session()  # unique per chat connection
 
-    if not hasattr(session, "_client"):
-        session._client = AskariPatrolAsyncClient()
+    client = getattr(session, "_client", None)
+    if client is None:
+        client = session._client = AskariPatrolAsyncClient()
         # Ensure the client is gracefully closed at end of session
-        session._exit_stack.push_async_callback(session._client.aclose)
+        session._exit_stack.push_async_callback(client.aclose)
 
-    return session._client
+    return client
 
 
 # ---------------------------------------------------------------------------
@@ -145,13 +167,14 @@ async def restore_session(token: str) -> dict:
         dict: ``{"success": True}`` on success or ``{"success": False}`` if the
             token is expired or structurally invalid.
     """
-    from common.utils import is_token_valid  # local import avoids circular dep
+    from common.utils import validate_and_decode  # local import avoids circular dep
 
     client = get_client()
-    if not is_token_valid(token):
+    payload = validate_and_decode(token)
+    if payload is None:
         return {"success": False, "message": "Token is expired or invalid"}
 
-    client._set_auth_header(token)
+    client._set_auth_header(token, payload)
     return {"success": True, "message": "Session restored"}
 
 
@@ -280,6 +303,49 @@ async def get_site_patrols(
     )
 
 
+@mcp.tool()
+@track_errors()
+async def get_all_site_patrols(
+    site_name: str,
+    start_date: str | None = None,
+    end_date: str | None = None,
+    start_time: str | None = None,
+    end_time: str | None = None,
+) -> GetAllSitePatrolsResponse:
+    """
+    Retrieve patrol records for a site across all pages, with optional
+    date/time filters. At most 100 patrols are returned; if more match,
+    ``truncated`` is true and a narrower date range should be used.
+    Requires authentication.
+
+    Args:
+        site_name: The exact name of the site. Example: "Riverside"
+        start_date: Start of date range filter (YYYY-MM-DD). Example: "2024-01-01"
+        end_date: End of date range filter (YYYY-MM-DD). Example: "2024-01-31"
+        start_time: Start of time range filter (HH:MM). Example: "08:00"
+        end_time: End of time range filter (HH:MM). Example: "18:00"
+
+    Returns:
+        GetAllSitePatrolsResponse: The patrol records, the total number that
+        matched and whether the list was truncated.
+
+    Raises:
+        LookupError: If the site name is not found or is ambiguous.
+
+    Examples:
+        get_all_site_patrols("Riverside", start_date="2024-01-01", end_date="2024-01-31")
+    """
+    client = get_client()
+    site_id = await client.resolve_site_id(site_name)
+    return await client.get_all_site_patrols(
+        site_id,
+        start_date=start_date,
+        end_date=end_date,
+        start_time=start_time,
+        end_time=end_time,
+    )
+
+
 @mcp.tool()
 @track_errors()
 async def get_site_call_logs(site_name: str, page: int = 1) -> GetSiteCallLogsResponse:
@@ -363,6 +429,44 @@ async def get_site_notifications(
     )
 
 
+@mcp.tool()
+@track_errors()
+async def get_site_overview(
+    site_name: str,
+    page: int = 1,
+    year: int | None = None,
+    month: int | None = None,
+) -> GetSiteOverviewResponse:
+    """
+    Get a site's shifts, call logs, notifications, patrols and monthly score
+    in one call. Prefer this over calling the individual site tools one
+    after another, e.g. for a site dashboard or status summary.
+    Requires authentication.
+
+    Args:
+        site_name: The exact name of the site. Example: "Riverside"
+        page: Page number applied to call logs, notifications and patrols.
+            Defaults to 1.
+        year: Year of the monthly score (e.g., 2024). Defaults to this year.
+        month: Month of the monthly score (1-12). Defaults to this month.
+
+    Returns:
+        GetSiteOverviewResponse: Shifts, call logs, notifications, patrols and
+            the monthly score for the site. Sections that could not be fetched
+            are null and explained under "errors".
+
+    Raises:
+        LookupError: If the site name is not found or is ambiguous.
+
+    Examples:
+        get_site_overview("Riverside")
+        get_site_overview("West Gate", year=2024, month=3)
+    """
+    client = get_client()
+    site_id = await client.resolve_site_id(site_name)
+    return await client.get_site_overview(site_id, page=page, year=year, month=month)
+
+
 # ---------------------------------------------------------------------------
 # Guard tools
 # ---------------------------------------------------------------------------
@@ -463,8 +567,44 @@ async def get_guard_performance_report(
     return await client.get_guard_performance_report(guard_id, year, month)
 
 
+def main():
+    """
+    Serve the MCP server over streamable HTTP.
+
+    Equivalent to ``mcp.run(transport="streamable-http")`` but runs Uvicorn
+    with the httptools parser and the uvloop event loop (asyncio where uvloop
+    is not installed, e.g. on Windows), and without per-request access logs.
+    Plain responses of at least 1 KiB are gzip-compressed for clients that
+    send ``Accept-Encoding: gzip``; SSE streams are left as is. A single
+    worker is used: MCP sessions live in process memory, so requests for one
+    session must reach the same process.
+
+    On SIGTERM/SIGINT Uvicorn stops accepting connections and waits up to
+    ``GRACEFUL_SHUTDOWN_TIMEOUT`` seconds for in-flight requests; long-lived
+    session streams would otherwise hold shutdown open indefinitely. The
+    lifespan then closes each session's API client.
+    """
+    import uvicorn
+    from starlette.middleware.gzip import GZipMiddleware
+
+    app = mcp.streamable_http_app()
+    app.add_middleware(GZipMiddleware, minimum_size=1024)
+
+    uvicorn.run(
+        app,
+        host=mcp.settings.host,
+        port=mcp.settings.port,
+        log_level=mcp.settings.log_level.lower(),
+        # uvloop when importable, asyncio otherwise
+        loop="auto",
+        http="httptools",
+        access_log=False,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
+    )
+
+
 if __name__ == "__main__":
     try:
-        mcp.run(transport="streamable-http")
+        main()
     except KeyboardInterrupt:
         print("👋 Program stopped by user. Goodbye!")
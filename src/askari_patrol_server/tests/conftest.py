@@ -0,0 +1,137 @@
+import time
+
+import jwt
+import pytest
+import pytest_asyncio
+
+from askari_patrol_server.api import AskariPatrolAsyncClient
+
+
+def _paginated(items: list[dict], page: int = 1) -> dict:
+    """Wrap items in the NestJS pagination envelope returned by the API."""
+    return {
+        "data": items,
+        "meta": {
+            "itemsPerPage": 10,
+            "totalItems": len(items),
+            "currentPage": page,
+            "totalPages": 1,
+            "sortBy": [],
+        },
+        "links": {"current": f"?page={page}"},
+    }
+
+
+_COMPANY = {
+    "registrationNumber": "REG-001",
+    "name": "Askari Security Ltd",
+    "address": "Plot 1, Kampala Road",
+}
+
+_SITE = {
+    "name": "Main Office",
+    "latitude": "0.3476",
+    "longitude": "32.5825",
+    "phoneNumber": "+256700000001",
+    "notificationsEnabled": True,
+    "notificationCycle": "HOURLY",
+    "patrolType": "NFC",
+    "securityGuardCount": 2,
+}
+
+_GUARD = {
+    "gender": "MALE",
+    "dateOfBirth": "1990-01-01",
+    "firstName": "John",
+    "lastName": "Doe",
+    "phoneNumber": "+256700000002",
+}
+
+
+@pytest.fixture(scope="session")
+def mock_token():
+    """A structurally valid JWT that expires an hour from now."""
+    return jwt.encode({"sub": "1", "exp": int(time.time()) + 3600}, "secret")
+
+
+@pytest.fixture(scope="session")
+def mock_login_response(mock_token):
+    return {"access_token": mock_token}
+
+
+@pytest.fixture(scope="session")
+def mock_paginated_site():
+    return _paginated([{**_SITE, "id": 42, "company": _COMPANY, "tags": []}])
+
+
+@pytest.fixture(scope="session")
+def mock_shifts():
+    return [
+        {
+            "type": "DAY",
+            "site": _SITE,
+            "securityGuards": [{**_GUARD, "company": _COMPANY}],
+        },
+        {
+            "type": "NIGHT",
+            "site": _SITE,
+            "securityGuards": [
+                {**_GUARD, "firstName": "Jane", "company": _COMPANY},
+            ],
+        },
+    ]
+
+
+@pytest.fixture(scope="session")
+def mock_paginated_call_log():
+    return _paginated(
+        [
+            {
+                "time": "08:00",
+                "date": "2023-10-01",
+                "isAnswered": True,
+                "response": "All clear",
+                "site": _SITE,
+                "answeredBy": _GUARD,
+            }
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_paginated_notification():
+    return _paginated(
+        [
+            {
+                "dateCreatedAt": "2023-10-01",
+                "timeCreatedAt": "09:15:00",
+                "site": {**_SITE, "company": _COMPANY},
+            }
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_paginated_patrol():
+    return _paginated(
+        [
+            {
+                "date": "2023-10-01",
+                "startTime": "22:00:00",
+                "securityGuard": _GUARD,
+                "securityGuardUniqueId": "SG-001",
+                "site": _SITE,
+            }
+        ]
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_paginated_guards():
+    return _paginated([{**_GUARD, "id": 10, "company": _COMPANY}], page=2)
+
+
+@pytest_asyncio.fixture
+async def client():
+    async with AskariPatrolAsyncClient() as client:
+        yield client
@@ -0,0 +1,477 @@
+"""
+Unit tests for the AskariPatrolAsyncClient.
+
+HTTP traffic is intercepted with respx's ``respx_mock`` fixture, with routes
+given relative to the client's base URL, so no request reaches the real
+Askari Patrol backend.
+"""
+
+import asyncio
+import time
+from datetime import date
+
+import httpx
+import jwt
+import pytest
+
+from askari_patrol_server import api
+from askari_patrol_server.api import (
+    CLOSED_MONTH_SCORE_CACHE_TTL,
+    SCORE_CACHE_TTL,
+    AskariPatrolAsyncClient,
+)
+
+SITE_ID = 42
+GUARD_ID = 10
+YEAR = 2023
+MONTH = 10
+
+SHIFTS_PATH = f"/sites/{SITE_ID}/shifts"
+CALL_LOGS_PATH = f"/sites/{SITE_ID}/call-logs"
+NOTIFICATIONS_PATH = f"/sites/{SITE_ID}/notifications"
+SITE_PATROLS_PATH = f"/sites/{SITE_ID}/patrols"
+GUARD_PATROLS_PATH = f"/users/security-guards/{GUARD_ID}/patrols"
+PERFORMANCE_PATH = f"/sites/{SITE_ID}/{YEAR}/{MONTH}/performance"
+
+
+def _expire_cache(client):
+    """Mark every cached response as expired, keeping the values."""
+    for key, (_, value) in client._cache.items():
+        client._cache[key] = (0.0, value)
+
+
+@pytest.mark.respx(base_url=AskariPatrolAsyncClient._BASE_URL)
+class TestAskariPatrolAsyncClient:
+    @pytest.fixture(autouse=True)
+    def _authenticate(self, request, client, mock_token):
+        """Log the client in unless the test is marked ``no_auth``."""
+        if request.node.get_closest_marker("no_auth") is None:
+            client._set_auth_header(mock_token)
+
+    @pytest.mark.asyncio
+    @pytest.mark.no_auth
+    async def test_login_success_and_auth_set(
+        self, respx_mock, client, mock_login_response, mock_token
+    ):
+        route = respx_mock.post("/auth/signin").mock(
+            return_value=httpx.Response(200, json=mock_login_response)
+        )
+
+        data = await client.login("admin", "secret")
+
+        assert route.called
+        assert data["access_token"] == mock_token
+        assert client.headers["Authorization"] == f"Bearer {mock_token}"
+
+    @pytest.mark.asyncio
+    @pytest.mark.no_auth
+    async def test_login_failure_raises_exception(self, respx_mock, client):
+        respx_mock.post("/auth/signin").mock(
+            return_value=httpx.Response(401, json={"message": "Unauthorized"})
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.login("admin", "wrong")
+        assert "Authorization" not in client.headers
+
+    @pytest.mark.asyncio
+    @pytest.mark.no_auth
+    async def test_is_authenticated_tracks_token_expiry(self, client, mock_token):
+        assert not client.is_authenticated()
+
+        client._set_auth_header(mock_token)
+        assert client.is_authenticated()
+
+        client._set_auth_header(jwt.encode({"exp": int(time.time()) - 60}, "secret"))
+        assert not client.is_authenticated()
+
+        client._set_auth_header(mock_token)
+        await client.logout()
+        assert not client.is_authenticated()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path, method, args, kwargs, params",
+        [
+            pytest.param(
+                SITE_PATROLS_PATH,
+                "get_site_patrols",
+                (SITE_ID,),
+                {},
+                {"page": "1"},
+                id="site",
+            ),
+            pytest.param(
+                GUARD_PATROLS_PATH,
+                "get_guard_patrols",
+                (GUARD_ID,),
+                {"start_date": "2023-10-01", "end_date": "2023-10-31"},
+                {"page": "1", "filter.date": "$btw:2023-10-01,2023-10-31"},
+                id="guard",
+            ),
+        ],
+    )
+    async def test_get_patrols_no_auth(
+        self,
+        respx_mock,
+        client,
+        mock_paginated_patrol,
+        path,
+        method,
+        args,
+        kwargs,
+        params,
+    ):
+        route = respx_mock.get(path).mock(
+            return_value=httpx.Response(200, json=mock_paginated_patrol)
+        )
+
+        data = await getattr(client, method)(*args, **kwargs)
+
+        assert route.called
+        assert dict(route.calls.last.request.url.params) == params
+        assert "Authorization" not in route.calls.last.request.headers
+        assert data["data"][0]["securityGuardUniqueId"] == "SG-001"
+        assert data["data"][0]["site"]["name"] == "Main Office"
+
+    @pytest.mark.asyncio
+    async def test_get_all_site_patrols(
+        self, respx_mock, client, mock_paginated_patrol
+    ):
+        patrol = mock_paginated_patrol["data"][0]
+
+        def page_response(request):
+            page = int(request.url.params["page"])
+            body = {
+                **mock_paginated_patrol,
+                "data": [{**patrol, "date": f"2023-10-0{page}"}],
+                "meta": {
+                    **mock_paginated_patrol["meta"],
+                    "totalItems": 3,
+                    "totalPages": 3,
+                },
+            }
+            return httpx.Response(200, json=body)
+
+        route = respx_mock.get(SITE_PATROLS_PATH).mock(side_effect=page_response)
+
+        result = await client.get_all_site_patrols(SITE_ID)
+
+        assert route.call_count == 3
+        assert [p["date"] for p in result["data"]] == [
+            "2023-10-01",
+            "2023-10-02",
+            "2023-10-03",
+        ]
+        assert result["totalItems"] == 3
+        assert not result["truncated"]
+
+        route.reset()
+        capped = await client.get_all_site_patrols(SITE_ID, max_pages=2)
+
+        assert route.call_count == 2
+        assert [p["date"] for p in capped["data"]] == ["2023-10-01", "2023-10-02"]
+        assert capped["totalItems"] == 3
+        assert capped["truncated"]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "path, params, method, args, kwargs, payload_fixture",
+        [
+            pytest.param(
+                "/sites",
+                {"search": "Main", "page": "2"},
+                "get_sites",
+                (),
+                {"query": "Main", "page": 2},
+                "mock_paginated_site",
+                id="search_sites",
+            ),
+            pytest.param(
+                SHIFTS_PATH,
+                {},
+                "get_site_shifts",
+                (SITE_ID,),
+                {},
+                "mock_shifts",
+                id="get_site_shifts",
+            ),
+            pytest.param(
+                CALL_LOGS_PATH,
+                {"page": "1"},
+                "get_site_call_logs",
+                (SITE_ID,),
+                {},
+                "mock_paginated_call_log",
+                id="get_site_call_logs",
+            ),
+            pytest.param(
+                NOTIFICATIONS_PATH,
+                {"page": "1", "filter.dateCreatedAt": "$gte:2023-10-01"},
+                "get_site_notifications",
+                (SITE_ID,),
+                {"start_date": "2023-10-01"},
+                "mock_paginated_notification",
+                id="get_site_notifications_open_ended_filter",
+            ),
+            pytest.param(
+                "/users/security-guards",
+                {"search": "John", "page": "2"},
+                "search_guards",
+                ("John",),
+                {"page": 2},
+                "mock_paginated_guards",
+                id="search_guards",
+            ),
+        ],
+    )
+    async def test_get_endpoint(
+        self,
+        request,
+        respx_mock,
+        client,
+        path,
+        params,
+        method,
+        args,
+        kwargs,
+        payload_fixture,
+    ):
+        payload = request.getfixturevalue(payload_fixture)
+        route = respx_mock.get(path).mock(
+            return_value=httpx.Response(200, json=payload)
+        )
+
+        data = await getattr(client, method)(*args, **kwargs)
+
+        assert route.called
+        assert dict(route.calls.last.request.url.params) == params
+        assert data == payload
+
+    @pytest.mark.asyncio
+    async def test_get_sites_default_page(
+        self, respx_mock, client, mock_paginated_site
+    ):
+        route = respx_mock.get("/sites").mock(
+            return_value=httpx.Response(200, json=mock_paginated_site)
+        )
+
+        await client.get_sites()
+
+        assert route.called
+        assert dict(route.calls.last.request.url.params) == {"page": "1"}
+
+    @pytest.mark.asyncio
+    async def test_get_sites_cached_until_logout(
+        self, respx_mock, client, mock_token, mock_paginated_site
+    ):
+        route = respx_mock.get("/sites").mock(
+            return_value=httpx.Response(200, json=mock_paginated_site)
+        )
+
+        first = await client.get_sites()
+        second = await client.get_sites()
+        assert route.call_count == 1
+        assert first == second
+
+        await client.logout()
+        client._set_auth_header(mock_token)
+        await client.get_sites()
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_response_served_on_upstream_error(
+        self, respx_mock, client, mock_shifts
+    ):
+        route = respx_mock.get(SHIFTS_PATH).mock(
+            side_effect=[
+                httpx.Response(200, json=mock_shifts),
+                httpx.Response(503),
+            ]
+        )
+
+        fresh = await client.get_site_shifts(SITE_ID)
+        _expire_cache(client)
+        stale = await client.get_site_shifts(SITE_ID)
+
+        assert route.call_count == 2
+        assert stale == fresh
+
+    @pytest.mark.asyncio
+    async def test_full_cache_evicts_one_entry_and_keeps_stale_fallback(
+        self, respx_mock, client, monkeypatch, mock_shifts, mock_paginated_site
+    ):
+        monkeypatch.setattr(api, "CACHE_MAX_ENTRIES", 4)
+        shifts = respx_mock.get(SHIFTS_PATH).mock(
+            side_effect=[httpx.Response(200, json=mock_shifts), httpx.Response(503)]
+        )
+        respx_mock.get("/sites").mock(
+            return_value=httpx.Response(200, json=mock_paginated_site)
+        )
+
+        for page in (1, 2, 3):
+            await client.get_sites(page=page)
+        fresh = await client.get_site_shifts(SITE_ID)
+        _expire_cache(client)
+
+        # Refreshing a cached key in a full cache evicts nothing
+        await client.get_sites(page=1)
+        assert len(client._cache) == 4
+        # A new key evicts one entry: the least recently used expired one
+        await client.get_sites(page=4)
+        assert len(client._cache) == 4
+        assert ("/sites?page=2", ()) not in client._cache
+
+        assert await client.get_site_shifts(SITE_ID) == fresh
+        assert shifts.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_duplicate_gets_share_one_request(
+        self, respx_mock, client, mock_shifts
+    ):
+        route = respx_mock.get(SHIFTS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_shifts)
+        )
+
+        first, second = await asyncio.gather(
+            client.get_site_shifts(SITE_ID), client.get_site_shifts(SITE_ID)
+        )
+
+        assert route.call_count == 1
+        assert first == second
+        assert not client._inflight
+
+    @pytest.mark.asyncio
+    async def test_fetch_started_before_relogin_is_not_cached(
+        self, respx_mock, client, mock_token, mock_shifts
+    ):
+        release = asyncio.Event()
+
+        async def slow_response(request):
+            await release.wait()
+            return httpx.Response(200, json=mock_shifts)
+
+        route = respx_mock.get(SHIFTS_PATH).mock(side_effect=slow_response)
+
+        fetch = asyncio.create_task(client.get_site_shifts(SITE_ID))
+        await asyncio.sleep(0)
+        await client.logout()
+        client._set_auth_header(mock_token)
+        release.set()
+
+        assert await fetch == mock_shifts
+        assert not client._cache
+
+        await client.get_site_shifts(SITE_ID)
+        assert route.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_get_site_guards(self, respx_mock, client, mock_shifts):
+        route = respx_mock.get(SHIFTS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_shifts)
+        )
+
+        guards = await client.get_site_guards(SITE_ID)
+
+        assert route.call_count == 1
+        assert [guard["firstName"] for guard in guards] == ["John", "Jane"]
+
+    @pytest.mark.asyncio
+    async def test_get_site_monthly_score(self, respx_mock, client):
+        route = respx_mock.get(PERFORMANCE_PATH).mock(
+            return_value=httpx.Response(200, text="0.0357")
+        )
+
+        score = await client.get_site_monthly_score(SITE_ID, YEAR, MONTH)
+
+        assert route.called
+        assert score == "3.57%"
+
+    @pytest.mark.asyncio
+    async def test_monthly_score_cached_briefly_until_month_closes(
+        self, respx_mock, client
+    ):
+        today = date.today()
+        respx_mock.get(path__regex=rf"/sites/{SITE_ID}/\d+/\d+/performance").mock(
+            return_value=httpx.Response(200, text="0.5")
+        )
+
+        await client.get_site_monthly_score(SITE_ID, YEAR, MONTH)
+        await client.get_site_monthly_score(SITE_ID, today.year, today.month)
+
+        def ttl(year, month):
+            path = f"/sites/{SITE_ID}/{year}/{month}/performance"
+            return client._cache[(path,)][0] - time.monotonic()
+
+        assert SCORE_CACHE_TTL < ttl(YEAR, MONTH) <= CLOSED_MONTH_SCORE_CACHE_TTL
+        assert ttl(today.year, today.month) <= SCORE_CACHE_TTL <= 300
+
+    @pytest.mark.asyncio
+    async def test_get_site_overview(
+        self,
+        respx_mock,
+        client,
+        mock_shifts,
+        mock_paginated_call_log,
+        mock_paginated_notification,
+        mock_paginated_patrol,
+    ):
+        respx_mock.get(SHIFTS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_shifts)
+        )
+        respx_mock.get(CALL_LOGS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_paginated_call_log)
+        )
+        respx_mock.get(NOTIFICATIONS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_paginated_notification)
+        )
+        respx_mock.get(SITE_PATROLS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_paginated_patrol)
+        )
+        respx_mock.get(PERFORMANCE_PATH).mock(
+            return_value=httpx.Response(200, text="0.5")
+        )
+
+        overview = await client.get_site_overview(SITE_ID, year=YEAR, month=MONTH)
+
+        assert overview["errors"] == {}
+        assert len(overview["shifts"]) == 2
+        assert overview["call_logs"]["data"][0]["response"] == "All clear"
+        assert overview["notifications"]["data"][0]["site"]["name"] == "Main Office"
+        assert overview["patrols"]["data"][0]["securityGuardUniqueId"] == "SG-001"
+        assert overview["monthly_score"] == "50.00%"
+
+    @pytest.mark.asyncio
+    async def test_get_site_overview_partial_failure(
+        self, respx_mock, client, mock_shifts, mock_paginated_patrol
+    ):
+        respx_mock.get(SHIFTS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_shifts)
+        )
+        respx_mock.get(CALL_LOGS_PATH).mock(return_value=httpx.Response(500))
+        respx_mock.get(NOTIFICATIONS_PATH).mock(
+            side_effect=httpx.ConnectError("connection refused")
+        )
+        respx_mock.get(SITE_PATROLS_PATH).mock(
+            return_value=httpx.Response(200, json=mock_paginated_patrol)
+        )
+        respx_mock.get(path__regex=rf"/sites/{SITE_ID}/\d+/\d+/performance").mock(
+            return_value=httpx.Response(200, text="0.5")
+        )
+
+        overview = await client.get_site_overview(SITE_ID)
+
+        assert overview["call_logs"] is None
+        assert overview["notifications"] is None
+        assert set(overview["errors"]) == {"call_logs", "notifications"}
+        assert len(overview["shifts"]) == 2
+        assert overview["patrols"]["data"][0]["site"]["name"] == "Main Office"
+
+    @pytest.mark.asyncio
+    async def test_get_site_overview_all_failed_raises(self, respx_mock, client):
+        respx_mock.get(path__regex=rf"/sites/{SITE_ID}/.*").mock(
+            return_value=httpx.Response(401)
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_site_overview(SITE_ID)
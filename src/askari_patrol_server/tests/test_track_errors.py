@@ -0,0 +1,38 @@
+import logging
+
+import pytest
+
+from askari_patrol_server.decorators.track_errors import track_errors
+
+
+class TestTrackErrorsWithoutRollbar:
+    """Test the local logging fallback used when Rollbar is not configured."""
+
+    @pytest.mark.asyncio
+    async def test_async_tool_error_is_logged_and_reraised(self, caplog):
+        @track_errors()
+        async def failing_tool():
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.ERROR), pytest.raises(ValueError):
+            await failing_tool()
+
+        assert "'failing_tool' raised an unhandled error: boom" in caplog.text
+
+    def test_sync_tool_error_is_logged_and_reraised(self, caplog):
+        @track_errors(tool_name="custom")
+        def failing_tool():
+            raise ValueError("boom")
+
+        with caplog.at_level(logging.ERROR), pytest.raises(ValueError):
+            failing_tool()
+
+        assert "'custom' raised an unhandled error: boom" in caplog.text
+
+    def test_wrapper_preserves_name_and_result(self):
+        @track_errors()
+        def tool():
+            return 1
+
+        assert tool.__name__ == "tool"
+        assert tool() == 1
@@ -5,12 +5,80 @@ This module provides a unified logging setup with support for console and file
 handlers, structured formatting, and environment-based configuration.
 """
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 from pathlib import Path
 
+import orjson
+
+# Third-party loggers capped at INFO unless the root logger is at DEBUG
+_NOISY_LOGGERS = ("httpx", "httpcore", "mcp")
+
+# Background writer for the file handler; replaced on each setup_logging call
+_file_listener: logging.handlers.QueueListener | None = None
+
+
+class OrjsonFormatter(logging.Formatter):
+    """Format records as one JSON object per line, serialised with orjson."""
+
+    # Last (second, formatted timestamp) pair; swapped as one tuple so the
+    # console and file-writer threads never see a mismatched pair
+    _last_time: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        # The timestamp only has one-second resolution, so records logged
+        # within the same second reuse the previous strftime result
+        second = int(record.created)
+        cached_second, cached = self._last_time
+        if second == cached_second:
+            return cached
+        formatted = super().formatTime(record, datefmt)
+        self._last_time = (second, formatted)
+        return formatted
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": self.formatTime(record, self.datefmt),
+            "level": record.levelname,
+            "module": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
+class _ExcInfoQueueHandler(logging.handlers.QueueHandler):
+    """
+    Queue handler that leaves formatting to the file handler's formatter.
+
+    The stock ``prepare()`` renders each record with a default formatter and
+    clears ``exc_info``, so the JSON formatter would never see the exception
+    and the traceback would be folded into ``message``. The listener runs in
+    this process, so the record can keep ``exc_info`` as is; only the message
+    is merged with its args here, in case they are mutated after the call.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        return record
+
+
+def _stop_file_listener() -> None:
+    """Flush and stop the background file writer, if one is running."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        _file_listener = None
+
 
 def setup_logging(
     log_level: str | None = None,
@@ -23,7 +91,8 @@ def setup_logging(
 
     This function sets up a comprehensive logging configuration with:
     - Console output with colored formatting (if supported)
-    - Optional rotating file handler for persistent logs
+    - Optional rotating file handler for persistent logs, written from a
+      background thread via a queue so logging calls never block on disk I/O
     - Structured formatting with timestamps and module information
     - Environment-based configuration via LOG_LEVEL, LOG_FILE, and LOG_FORMAT
 
@@ -41,11 +110,18 @@ def setup_logging(
         >>> logger = logging.getLogger(__name__)
         >>> logger.info("Application started")
     """
+    global _file_listener
+
     # Resolve configuration from environment or defaults
     log_level = log_level or os.getenv("LOG_LEVEL", "INFO").upper()
     log_file = log_file or os.getenv("LOG_FILE", "logs/askari_patrol.log")
     log_format = log_format or os.getenv("LOG_FORMAT", "standard").lower()
 
+    # Skip per-record thread/process lookups; no format uses them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Convert log level string to logging constant
     numeric_level = getattr(logging, log_level, logging.INFO)
 
@@ -53,17 +129,23 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
 
+    # Chatty libraries log every request at DEBUG; above DEBUG, drop those at
+    # the logger instead of building records only for the handlers to discard
+    # them. At DEBUG the operator wants them, so the loggers inherit the root.
+    for name in _NOISY_LOGGERS:
+        if numeric_level > logging.DEBUG:
+            logging.getLogger(name).setLevel(max(numeric_level, logging.INFO))
+        else:
+            logging.getLogger(name).setLevel(logging.NOTSET)
+
     # Remove existing handlers to avoid duplicates
     root_logger.handlers.clear()
+    _stop_file_listener()
 
     # Define log formats
     if log_format == "json":
         # Structured JSON format for production/parsing
-        formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"module": "%(name)s", "message": "%(message)s"}',
-            datefmt="%Y-%m-%dT%H:%M:%S%z",
-        )
+        formatter = OrjsonFormatter(datefmt="%Y-%m-%dT%H:%M:%S%z")
     else:
         # Human-readable format for development
         formatter = logging.Formatter(
@@ -93,13 +175,26 @@ def setup_logging(
             )
             file_handler.setLevel(numeric_level)
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
 
-            root_logger.info(f"File logging enabled: {log_file}")
+            # Callers only enqueue; the listener thread formats and writes
+            log_queue = queue.SimpleQueue()
+            queue_handler = _ExcInfoQueueHandler(log_queue)
+            queue_handler.setLevel(numeric_level)
+            root_logger.addHandler(queue_handler)
+
+            _file_listener = logging.handlers.QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _file_listener.start()
+
+            root_logger.info("File logging enabled: %s", log_file)
         except Exception as e:
-            root_logger.warning(f"Failed to set up file logging: {e}")
+            root_logger.warning("Failed to set up file logging: %s", e)
+
+    root_logger.info("Logging configured: level=%s, format=%s", log_level, log_format)
+
 
-    root_logger.info(f"Logging configured: level={log_level}, format={log_format}")
+atexit.register(_stop_file_listener)
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -1,6 +1,7 @@
-import asyncio
+import functools
 import logging
 import os
+import sys
 from typing import Any
 
 import rollbar
@@ -8,19 +9,22 @@ import rollbar
 logger = logging.getLogger(__name__)
 
 ROLLBAR_SERVER_TOKEN = os.getenv("ROLLBAR_SERVER_TOKEN")
+CODE_VERSION = os.getenv("CODE_VERSION", "1.0.0")
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
 
 
+@functools.cache
 def initialize_rollbar():
-    """Initialize Rollbar globally, safe to call multiple times."""
+    """Initialize Rollbar globally, safe to call multiple times (runs once)."""
     if not ROLLBAR_SERVER_TOKEN:
         logger.warning("Rollbar not initialized: ROLLBAR_SERVER_TOKEN not set")
         return False
 
     rollbar.init(
         access_token=ROLLBAR_SERVER_TOKEN,
-        code_version=os.getenv("CODE_VERSION", "1.0.0"),
+        code_version=CODE_VERSION,
         enabled=True,
-        environment=os.getenv("ENVIRONMENT", "development"),
+        environment=ENVIRONMENT,
     )
 
     logger.info("Rollbar initialized")
@@ -36,28 +40,27 @@ async def report_error_to_rollbar_async(
     """
     Report an exception to Rollbar asynchronously.
 
+    The payload is built on the event loop; Rollbar's default thread handler
+    then posts it from its own thread, so the loop never waits on the
+    network and no extra thread-pool hop is needed.
+
     Parameters:
         exc: Optional exception object. If None, uses the current exception in context.
         level: Rollbar level ("error", "warning", "info", "critical")
         extra_data: Dict of additional metadata
         payload_data: Dict to pass directly to Rollbar payload
     """
+    if not ROLLBAR_SERVER_TOKEN:
+        return
 
-    def _report():
-        if exc:
-            rollbar.report_exc_info(
-                (type(exc), exc, exc.__traceback__),
-                extra_data=extra_data,
-                payload_data=payload_data,
-                level=level,
-            )
-        else:
-            rollbar.report_exc_info(
-                extra_data=extra_data, payload_data=payload_data, level=level
-            )
-
+    # Capture here: a background report task has no active exception of its own
+    exc_info = (type(exc), exc, exc.__traceback__) if exc else sys.exc_info()
     try:
-        if ROLLBAR_SERVER_TOKEN:
-            await asyncio.to_thread(_report)
+        rollbar.report_exc_info(
+            exc_info,
+            extra_data=extra_data,
+            payload_data=payload_data,
+            level=level,
+        )
     except Exception as e:
-        print(f"Rollbar reporting failed: {e}")
+        logger.warning("Rollbar reporting failed: %s", e)
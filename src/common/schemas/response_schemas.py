@@ -11,7 +11,7 @@ from common.schemas.base_schemas import (
     Company,
 )
 from common.schemas.pagination_schemas import PaginatedResponse
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 T = TypeVar("T")
 
@@ -110,6 +110,25 @@ GetSiteGuardsResponse = list[SecurityGuardInShift]
 GetSitePatrolsResponse = PaginatedResponse[SitePatrolListItem]
 
 
+class GetAllSitePatrolsResponse(BaseModel):
+    """Schema for a site's patrols gathered across result pages."""
+
+    data: list[SitePatrolListItem]
+    totalItems: int
+    truncated: bool
+
+
+class GetSiteOverviewResponse(BaseModel):
+    """Schema for the combined site overview (shifts, calls, alerts, patrols, score)."""
+
+    shifts: GetSiteShiftsResponse | None = None
+    call_logs: GetSiteCallLogsResponse | None = None
+    notifications: GetSiteNotificationsResponse | None = None
+    patrols: GetSitePatrolsResponse | None = None
+    monthly_score: str | None = None
+    errors: dict[str, str] = Field(default_factory=dict)
+
+
 class LoginResponse(BaseModel):
     """Schema for the successful login response."""
 
@@ -0,0 +1,67 @@
+import logging
+
+import orjson
+import pytest
+from common import logging_config
+from common.logging_config import setup_logging
+
+
+@pytest.fixture(autouse=True)
+def _restore_logging():
+    root = logging.getLogger()
+    handlers, level = root.handlers[:], root.level
+    noisy = {
+        name: logging.getLogger(name).level for name in logging_config._NOISY_LOGGERS
+    }
+    yield
+    logging_config._stop_file_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    for name, noisy_level in noisy.items():
+        logging.getLogger(name).setLevel(noisy_level)
+
+
+class TestNoisyLoggers:
+    """Test the level cap applied to chatty third-party loggers."""
+
+    def test_capped_at_info_above_debug(self):
+        """Test httpx DEBUG records are dropped when the root is at INFO"""
+        setup_logging(log_level="INFO", enable_file_logging=False)
+        assert not logging.getLogger("httpx").isEnabledFor(logging.DEBUG)
+
+    def test_not_capped_at_debug(self):
+        """Test LOG_LEVEL=DEBUG also enables DEBUG for httpx, even after a
+        previous call capped it"""
+        setup_logging(log_level="INFO", enable_file_logging=False)
+        setup_logging(log_level="DEBUG", enable_file_logging=False)
+        assert logging.getLogger("httpx").isEnabledFor(logging.DEBUG)
+
+
+class TestFileLogging:
+    """Test records written through the background file writer."""
+
+    @pytest.mark.parametrize("log_format", ["json", "standard"])
+    def test_logged_exception_keeps_traceback(self, tmp_path, log_format):
+        """Test logger.exception output in the file includes the traceback
+        once, after the message"""
+        log_file = tmp_path / "app.log"
+        setup_logging(log_level="INFO", log_file=str(log_file), log_format=log_format)
+
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.getLogger("test").exception("failed for %s", "site 7")
+        logging_config._stop_file_listener()
+
+        line = next(
+            line for line in log_file.read_text().splitlines() if "failed for" in line
+        )
+        if log_format == "json":
+            entry = orjson.loads(line)
+            assert entry["message"] == "failed for site 7"
+            assert "ValueError: boom" in entry["exc_info"]
+        else:
+            text = log_file.read_text()
+            assert line.endswith("failed for site 7")
+            assert text.count("Traceback") == 1
+            assert "ValueError: boom" in text
@@ -0,0 +1,122 @@
+import hashlib
+import time
+from collections import OrderedDict
+
+import jwt
+from common import utils
+from common.utils import decode_token_payload, is_token_valid, validate_and_decode
+
+SECRET = "secret"
+
+
+def _token(**claims):
+    return jwt.encode(claims, SECRET)
+
+
+class TestIsTokenValid:
+    """Test JWT validation with and without a signing secret."""
+
+    def test_unexpired_token_is_valid(self):
+        """Test a token expiring in the future passes the expiry-only check"""
+        assert is_token_valid(_token(exp=int(time.time()) + 60))
+
+    def test_token_without_exp_is_valid(self):
+        """Test a token with no exp claim is not treated as expired"""
+        assert is_token_valid(_token(sub="1"))
+
+    def test_expired_token_is_rejected(self):
+        """Test a token whose exp has passed is rejected"""
+        assert not is_token_valid(_token(exp=int(time.time()) - 60))
+        assert not is_token_valid(_token(exp=int(time.time()) - 60), SECRET)
+
+    def test_malformed_token_is_rejected(self):
+        """Test tokens with the wrong shape or a non-JSON payload are rejected"""
+        assert not is_token_valid("not-a-jwt")
+        assert not is_token_valid("a.b.c")
+        assert not is_token_valid("a.b.c.d")
+        _, payload, signature = _token(sub="1").split(".")
+        assert not is_token_valid(f".{payload}.{signature}")
+        assert not is_token_valid(_token(exp="tomorrow"))
+        assert not is_token_valid(_token(exp=None))
+
+    def test_malformed_header_or_signature_is_rejected(self):
+        """Test the header and signature segments are checked like jwt.decode"""
+        _, payload, signature = _token(exp=int(time.time()) + 60).split(".")
+        assert not is_token_valid(f"!!notb64.{payload}.{signature}")
+        assert not is_token_valid(f"W10.{payload}.{signature}")  # header is []
+        assert not is_token_valid(f"e30.{payload}.abcde")  # bad signature padding
+        assert is_token_valid(f"e30.{payload}.{signature}")  # header is {}
+
+    def test_exp_is_coerced_like_pyjwt(self):
+        """Test a numeric-string exp is accepted, as jwt.decode accepts it"""
+        assert is_token_valid(_token(exp=str(int(time.time()) + 60)))
+        assert not is_token_valid(_token(exp=str(int(time.time()) - 60)))
+
+    def test_signature_is_verified_when_secret_given(self):
+        """Test the signature is checked only when a secret is supplied"""
+        token = _token(exp=int(time.time()) + 60)
+        assert is_token_valid(token, SECRET)
+        assert not is_token_valid(token, "wrong-secret")
+
+
+class TestValidateAndDecode:
+    """Test validation that also returns the token's claims."""
+
+    def test_returns_payload_for_valid_token(self):
+        """Test the decoded claims are returned with and without a secret"""
+        exp = int(time.time()) + 60
+        token = _token(sub="1", exp=exp)
+        assert validate_and_decode(token) == {"sub": "1", "exp": exp}
+        assert validate_and_decode(token, SECRET) == {"sub": "1", "exp": exp}
+
+    def test_returns_none_for_invalid_token(self):
+        """Test expired or wrongly signed tokens yield None"""
+        assert validate_and_decode(_token(exp=int(time.time()) - 60)) is None
+        assert validate_and_decode(_token(sub="1"), "wrong-secret") is None
+
+
+class TestDecodeTokenPayload:
+    """Test unverified payload decoding and its memo."""
+
+    def test_expired_token_payload_is_decoded(self):
+        """Test claims are returned even when the token has expired"""
+        token = _token(sub="1", exp=1)
+        assert decode_token_payload(token) == {"sub": "1", "exp": 1}
+        assert decode_token_payload("not-a-jwt") is None
+
+    def test_memo_is_keyed_by_digest(self, monkeypatch):
+        """Test a repeated token is decoded once and never stored raw"""
+        monkeypatch.setattr(utils, "_decoded_payloads", OrderedDict())
+        calls = []
+        decoder = utils._jwt_decoder()
+
+        class CountingDecoder:
+            def decode(self, token, **kwargs):
+                calls.append(token)
+                return decoder.decode(token, **kwargs)
+
+        monkeypatch.setattr(utils, "_jwt_decoder", CountingDecoder)
+        token = _token(sub="1")
+
+        decode_token_payload(token)["sub"] = "2"
+        assert decode_token_payload(token) == {"sub": "1"}
+        assert len(calls) == 1
+        assert all(len(key) == 16 for key in utils._decoded_payloads)
+        assert token not in utils._decoded_payloads
+
+    def test_full_memo_evicts_least_recently_used(self, monkeypatch):
+        """Test a full memo drops only its least recently used entry"""
+        monkeypatch.setattr(utils, "_decoded_payloads", OrderedDict())
+        monkeypatch.setattr(utils, "DECODED_CACHE_MAX_ENTRIES", 2)
+        first, second, third = (_token(sub=str(i)) for i in range(3))
+
+        decode_token_payload(first)
+        decode_token_payload(second)
+        decode_token_payload(first)
+        decode_token_payload(third)
+
+        assert len(utils._decoded_payloads) == 2
+        assert decode_token_payload(first) == {"sub": "0"}
+        assert len(utils._decoded_payloads) == 2
+        digest = hashlib.blake2b(second.encode(), digest_size=16).digest()
+        assert digest not in utils._decoded_payloads
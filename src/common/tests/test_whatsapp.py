@@ -1,5 +1,10 @@
 import pytest
-from common.whatsapp import convert_markdown_to_whatsapp
+from common.whatsapp import (
+    WhatsAppRenderer,
+    convert_markdown_to_whatsapp,
+    split_whatsapp_message,
+)
+from mistletoe import Document
 
 
 class TestBasicFormatting:
@@ -652,6 +657,22 @@ class TestEdgeCases:
         result = convert_markdown_to_whatsapp(md)
         assert "This is plain text" in result
 
+    @pytest.mark.parametrize(
+        "md",
+        [
+            "Line one\nLine two\n\n\n\nNext paragraph",
+            "\n\nLeading and trailing blank lines\n\n",
+            "1. Looks like a list\nbut 2023 is just a year",
+            "Tab\tand form\x0cfeed",
+            "Trailing space \nand C# or e-mail",
+        ],
+    )
+    def test_plain_text_matches_full_render(self, md):
+        """Test the plain-text shortcut renders exactly like mistletoe"""
+        with WhatsAppRenderer() as renderer:
+            expected = renderer.render(Document(md))
+        assert convert_markdown_to_whatsapp(md) == expected
+
     def test_escaped_characters(self):
         """Test escaped markdown characters"""
         md = r"This has \*escaped\* asterisks"
@@ -784,6 +805,40 @@ class TestWithFixtures:
         assert "def hello():" in result
 
 
+class TestSplitWhatsAppMessage:
+    """Test splitting long replies into WhatsApp-sized chunks."""
+
+    def test_short_message_is_not_split(self):
+        """Test text within the limit comes back as a single chunk"""
+        assert split_whatsapp_message("Short message") == ["Short message"]
+        assert split_whatsapp_message("") == []
+
+    def test_splits_on_paragraphs(self):
+        """Test paragraphs are kept whole when each fits the limit"""
+        text = "First paragraph.\n\nSecond paragraph."
+        assert split_whatsapp_message(text, limit=20) == [
+            "First paragraph.",
+            "Second paragraph.",
+        ]
+
+    def test_splits_long_sentence_on_words(self):
+        """Test a sentence over the limit breaks between words"""
+        chunks = split_whatsapp_message("alpha beta gamma delta", limit=11)
+        assert chunks == ["alpha beta", "gamma delta"]
+
+    def test_hard_splits_unbroken_text(self):
+        """Test text with no break points is cut at the limit"""
+        chunks = split_whatsapp_message("A" * 2000, limit=1600)
+        assert chunks == ["A" * 1600, "A" * 400]
+
+    def test_chunks_respect_limit(self):
+        """Test every chunk of a long mixed document fits the limit"""
+        text = ("Sentence one. Sentence two! " * 40 + "\n") * 10
+        chunks = split_whatsapp_message(text, limit=100)
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert " ".join(chunks).split() == text.split()
+
+
 # Parametrized tests for repetitive cases
 @pytest.mark.parametrize(
     "md,expected",
@@ -5,24 +5,120 @@ This module provides shared helpers used by both the MCP server and the
 async API client, primarily for JWT validation and payload inspection.
 """
 
+import binascii
+import functools
+import hashlib
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
 
-import jwt
-from jwt.exceptions import ExpiredSignatureError, InvalidTokenError
+import orjson
+import pybase64
 
 logger = logging.getLogger(__name__)
 
+# Decode options are built once and shared by every call
+_DEFAULT_ALGORITHMS = ["HS256"]
+_VERIFY_OPTIONS = {"verify_signature": True, "verify_exp": True}
+_PAYLOAD_ONLY_OPTIONS = {
+    "verify_signature": False,
+    "verify_exp": False,
+    "verify_aud": False,
+}
 
-def is_token_valid(
+# Unverified payloads keyed by a BLAKE2b digest of the token, so the memo
+# never holds raw bearer tokens; None marks a token that failed to decode.
+# Least recently used first, so a full memo evicts one cold entry.
+DECODED_CACHE_MAX_ENTRIES = 256
+_decoded_payloads: OrderedDict[bytes, dict[str, Any] | None] = OrderedDict()
+
+
+@functools.cache
+def _jwt_decoder():
+    """
+    Build the shared PyJWT decoder on first use.
+
+    The decoder parses payloads with orjson through PyJWT's documented
+    ``_decode_payload`` override hook. PyJWT itself is imported here rather
+    than at module level because it takes ~20 ms to import.
+
+    Returns:
+        jwt.PyJWT: A decoder whose ``decode`` matches :func:`jwt.decode`.
+    """
+    import jwt
+
+    class OrjsonPyJWT(jwt.PyJWT):
+        def _decode_payload(self, decoded: dict[str, Any]) -> Any:
+            try:
+                payload = orjson.loads(decoded["payload"])
+            except orjson.JSONDecodeError as e:
+                raise jwt.DecodeError(f"Invalid payload string: {e}") from e
+            if not isinstance(payload, dict):
+                raise jwt.DecodeError("Invalid payload string: must be a json object")
+            return payload
+
+    return OrjsonPyJWT()
+
+
+def _b64url_decode(segment: str) -> bytes:
+    """Decode an unpadded base64url JWT segment the way PyJWT does."""
+    return pybase64.urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def _fast_prescan(token: str) -> dict[str, Any] | None:
+    """
+    Cheaply reject malformed or expired tokens without running PyJWT.
+
+    Applies the same structural checks as an unverified ``jwt.decode``:
+    every segment must be valid base64url, and the header and payload must
+    be JSON objects. The signature itself is not checked.
+
+    Args:
+        token: The encoded JWT string to inspect.
+
+    Returns:
+        dict[str, Any] | None: The payload if the token is well formed and
+            its ``exp`` claim is absent or still in the future, else ``None``.
+    """
+    if not isinstance(token, str):
+        return None
+
+    # Counting dots rejects garbage without allocating the split parts
+    if token.count(".") != 2:
+        return None
+
+    header, segment, signature = token.split(".")
+    try:
+        if not isinstance(orjson.loads(_b64url_decode(header)), dict):
+            return None
+        payload = orjson.loads(_b64url_decode(segment))
+        _b64url_decode(signature)
+    except (binascii.Error, ValueError):
+        return None
+
+    if not isinstance(payload, dict):
+        return None
+
+    if "exp" not in payload:
+        return payload
+    # Coerce like PyJWT, which accepts any value int() does
+    try:
+        exp = int(payload["exp"])
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return payload if exp > time.time() else None
+
+
+def validate_and_decode(
     token: str, secret_key: str | None = None, algorithms: list[str] | None = None
-) -> bool:
+) -> dict[str, Any] | None:
     """
-    Validate a JWT by checking its signature and expiration claim.
+    Validate a JWT like :func:`is_token_valid` and return its payload.
 
-    When ``secret_key`` is provided the token signature is fully verified.
-    When it is ``None`` only the ``exp`` claim is checked — useful for
-    client-side expiry detection where the signing secret is unavailable.
+    Callers that need the claims of a token they have just validated should
+    use this instead of following :func:`is_token_valid` with
+    :func:`decode_token_payload`, which would decode the payload twice.
 
     Args:
         token: The encoded JWT string to validate.
@@ -31,37 +127,67 @@ def is_token_valid(
         algorithms: Acceptable signing algorithms.  Defaults to ``["HS256"]``.
 
     Returns:
-        bool: ``True`` if the token is structurally valid and has not expired,
-            ``False`` otherwise.
+        dict[str, Any] | None: The decoded payload if the token is valid,
+            ``None`` otherwise.
     """
     if algorithms is None:
-        algorithms = ["HS256"]
+        algorithms = _DEFAULT_ALGORITHMS
+
+    # Most rejections are expired sessions; catch those before PyJWT
+    payload = _fast_prescan(token)
+    if payload is None:
+        logger.debug("Token rejected: expired or malformed.")
+        return None
+
+    # No secret available — the prescan already checked expiry, which is all
+    # a client-side check can do
+    if not secret_key:
+        return payload
+
+    import jwt  # deferred: ~20 ms to import and unused on the prescan path
 
     try:
-        if secret_key:
-            jwt.decode(
-                token,
-                key=secret_key,
-                algorithms=algorithms,
-                options={"verify_signature": True, "verify_exp": True},
-            )
-        else:
-            # No secret available — verify expiry only (safe for client-side checks).
-            jwt.decode(token, options={"verify_signature": False, "verify_exp": True})
-
-        return True
-
-    except ExpiredSignatureError:
+        return _jwt_decoder().decode(
+            token,
+            key=secret_key,
+            algorithms=algorithms,
+            options=_VERIFY_OPTIONS,
+        )
+
+    except jwt.ExpiredSignatureError:
         logger.debug("Token rejected: expired.")
-        return False
+        return None
 
-    except InvalidTokenError as e:
+    except jwt.InvalidTokenError as e:
         logger.debug("Token rejected: invalid structure or signature. %s", e)
-        return False
+        return None
 
     except Exception:
         logger.exception("Unexpected error during token validation.")
-        return False
+        return None
+
+
+def is_token_valid(
+    token: str, secret_key: str | None = None, algorithms: list[str] | None = None
+) -> bool:
+    """
+    Validate a JWT by checking its signature and expiration claim.
+
+    When ``secret_key`` is provided the token signature is fully verified.
+    When it is ``None`` only the ``exp`` claim is checked — useful for
+    client-side expiry detection where the signing secret is unavailable.
+
+    Args:
+        token: The encoded JWT string to validate.
+        secret_key: Optional HMAC secret used to verify the signature.
+            Defaults to ``None`` (expiry-only check).
+        algorithms: Acceptable signing algorithms.  Defaults to ``["HS256"]``.
+
+    Returns:
+        bool: ``True`` if the token is structurally valid and has not expired,
+            ``False`` otherwise.
+    """
+    return validate_and_decode(token, secret_key, algorithms) is not None
 
 
 def decode_token_payload(token: str) -> dict[str, Any] | None:
@@ -71,6 +197,7 @@ def decode_token_payload(token: str) -> dict[str, Any] | None:
     This function deliberately skips signature and expiry checks, making it
     safe to call on already-expired tokens when you only need to inspect
     claims (e.g. to display a username or company name after session expiry).
+    Repeated calls with the same token reuse the first decode.
 
     Args:
         token: The encoded JWT string to decode.
@@ -83,15 +210,20 @@ def decode_token_payload(token: str) -> dict[str, Any] | None:
         Do **not** use this function to make access-control decisions.
         Use :func:`is_token_valid` for that purpose.
     """
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
     try:
-        return jwt.decode(
-            token,
-            options={
-                "verify_signature": False,
-                "verify_exp": False,
-                "verify_aud": False,
-            },
-        )
-    except Exception:
-        logger.exception("Failed to decode token payload.")
-        return None
+        payload = _decoded_payloads[key]
+    except KeyError:
+        try:
+            payload = _jwt_decoder().decode(token, options=_PAYLOAD_ONLY_OPTIONS)
+        except Exception:
+            logger.exception("Failed to decode token payload.")
+            payload = None
+        if len(_decoded_payloads) >= DECODED_CACHE_MAX_ENTRIES:
+            _decoded_payloads.popitem(last=False)
+        _decoded_payloads[key] = payload
+    else:
+        _decoded_payloads.move_to_end(key)
+
+    # Copy so callers can't alter the memoised payload
+    return dict(payload) if payload is not None else None
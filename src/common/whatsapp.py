@@ -10,14 +10,44 @@ WhatsApp Formatting Support:
 - Code blocks: ```text```
 """
 
+import functools
 import os
 import re
+import threading
 from typing import Any
 
 import httpx
+import orjson
 from mistletoe import Document
 from mistletoe.base_renderer import BaseRenderer
 
+# Maximum characters Twilio accepts in a single WhatsApp message body
+WHATSAPP_MESSAGE_LIMIT = 1600
+
+TWILIO_TYPING_INDICATOR_URL = "https://messaging.twilio.com/v2/Indicators/Typing.json"
+
+# Default Twilio credentials, read once at import like the WhatsApp client does
+_TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
+_TWILIO_AUTH_TOKEN = os.getenv("TWILIO_AUTH_TOKEN")
+
+# Sentence ending (punctuation run plus trailing whitespace), kept by split
+_SENTENCE_RE = re.compile(r"([.!?]+[\s\n]+)")
+
+# Anything that could make mistletoe render text differently from plain
+# paragraphs: inline markup, entities/HTML, whitespace other than spaces and
+# newlines (tabs, form feeds and Unicode separators also break lines),
+# indentation, block markers at line start, and trailing spaces
+_MARKDOWN_SYNTAX_RE = re.compile(
+    r"[*_`~\[\]|\\<&]|[^\S \n]|^[ #>=+\-]| $|^\d*[.)]", re.MULTILINE
+)
+_BLANK_LINES_RE = re.compile(r"\n{2,}")
+
+# Separator drawn above, between and below table cards
+_CARD_DIVIDER = "─" * 20
+
+# Stand-in for a Markdown horizontal rule, which WhatsApp cannot display
+_THEMATIC_BREAK = "─" * 17 + "\n\n"
+
 
 class WhatsAppRenderer(BaseRenderer):
     """
@@ -134,7 +164,7 @@ class WhatsAppRenderer(BaseRenderer):
         Render horizontal rules
         WhatsApp doesn't support HR, so use a visual separator
         """
-        return "─────────────────\n\n"
+        return _THEMATIC_BREAK
 
     def render_table(self, token):
         """
@@ -153,7 +183,7 @@ class WhatsAppRenderer(BaseRenderer):
         if hasattr(token, "children"):
             for _, row in enumerate(token.children):
                 # Add divider between cards
-                result.append("─" * 20)
+                result.append(_CARD_DIVIDER)
 
                 row_cells = list(row.children)
                 for j, cell in enumerate(row_cells):
@@ -163,7 +193,7 @@ class WhatsAppRenderer(BaseRenderer):
 
             # Final divider
             if result:
-                result.append("─" * 20)
+                result.append(_CARD_DIVIDER)
 
         return "\n".join(result) + "\n\n" if result else "\n"
 
@@ -263,10 +293,27 @@ class WhatsAppRenderer(BaseRenderer):
         return "\n"
 
 
+# One renderer per thread: building one maps every token type to its render
+# method, and rendering mutates list_depth, so instances are not shared
+_renderers = threading.local()
+
+
+def _get_renderer() -> WhatsAppRenderer:
+    """Return this thread's WhatsAppRenderer, creating it on first use."""
+    renderer = getattr(_renderers, "renderer", None)
+    if renderer is None:
+        renderer = _renderers.renderer = WhatsAppRenderer()
+    return renderer
+
+
+@functools.lru_cache(maxsize=512)
 def convert_markdown_to_whatsapp(markdown_text: str) -> str:
     """
     Convert standard Markdown to WhatsApp-compatible format
 
+    Results are memoised, so repeated replies (greetings, error and help
+    messages) skip re-parsing.
+
     Args:
         markdown_text: Standard markdown string
 
@@ -278,9 +325,25 @@ def convert_markdown_to_whatsapp(markdown_text: str) -> str:
         >>> wa = convert_markdown_to_whatsapp(md)
         >>> print(wa)
     """
-    with WhatsAppRenderer() as renderer:
-        doc = Document(markdown_text)
-        return renderer.render(doc)
+    # Plain text renders as its paragraphs separated by one blank line, so
+    # skip the parse when there is no syntax to interpret
+    if not _MARKDOWN_SYNTAX_RE.search(markdown_text):
+        paragraphs = _BLANK_LINES_RE.split(markdown_text.strip("\n"))
+        return "\n\n".join(p for p in paragraphs if p) + "\n"
+
+    renderer = _get_renderer()
+    # Discard depth left over if a previous render raised inside a list
+    renderer.list_depth = 0
+    return renderer.render(Document(markdown_text))
+
+
+@functools.cache
+def _get_typing_indicator_client() -> httpx.Client:
+    """Return a process-wide client so repeated indicators reuse one connection."""
+    return httpx.Client(
+        timeout=httpx.Timeout(5.0),
+        transport=httpx.HTTPTransport(http2=True, retries=2),
+    )
 
 
 def send_typing_indicator(
@@ -304,8 +367,8 @@ def send_typing_indicator(
     Raises:
         httpx.HTTPStatusError: If the request fails
     """
-    account_sid = account_sid or os.getenv("TWILIO_ACCOUNT_SID")
-    auth_token = auth_token or os.getenv("TWILIO_AUTH_TOKEN")
+    account_sid = account_sid or _TWILIO_ACCOUNT_SID
+    auth_token = auth_token or _TWILIO_AUTH_TOKEN
 
     if not account_sid or not auth_token:
         raise ValueError(
@@ -313,17 +376,46 @@ def send_typing_indicator(
         )
 
     data = {"messageId": message_id, "channel": channel}
-    response = httpx.post(
-        "https://messaging.twilio.com/v2/Indicators/Typing.json",
+    response = _get_typing_indicator_client().post(
+        TWILIO_TYPING_INDICATOR_URL,
         auth=(account_sid, auth_token),
         data=data,
     )
     response.raise_for_status()
 
-    return response.json()
+    return orjson.loads(response.content)
 
 
-def split_whatsapp_message(text: str, limit: int = 1600) -> list[str]:
+async def send_typing_indicator_async(
+    client: httpx.AsyncClient,
+    message_id: str,
+    channel: str = "whatsapp",
+) -> dict[Any, Any]:
+    """
+    Send a typing indicator via Twilio API using a shared async client.
+
+    Reusing one client keeps the connection to Twilio alive between calls,
+    avoiding a new TCP/TLS handshake for every indicator.
+
+    Args:
+        client: Async HTTP client already configured with Twilio credentials
+        message_id: The Twilio message SID to show typing for
+        channel: The messaging channel (default: "whatsapp")
+
+    Returns:
+        Dict containing the API response
+
+    Raises:
+        httpx.HTTPStatusError: If the request fails
+    """
+    data = {"messageId": message_id, "channel": channel}
+    response = await client.post(TWILIO_TYPING_INDICATOR_URL, data=data)
+    response.raise_for_status()
+
+    return orjson.loads(response.content)
+
+
+def split_whatsapp_message(text: str, limit: int = WHATSAPP_MESSAGE_LIMIT) -> list[str]:
     """
     Split a message into chunks that fit within the Twilio/WhatsApp character limit.
 
@@ -353,34 +445,42 @@ def split_whatsapp_message(text: str, limit: int = 1600) -> list[str]:
         return [text] if text else []
 
     chunks = []
-    current_chunk = ""
+    # Pieces of the chunk being built, joined once on flush; current_len
+    # tracks their combined length so nothing is re-concatenated per piece
+    current_chunk: list[str] = []
+    current_len = 0
 
     def flush_chunk():
         """Add current chunk to results and reset."""
-        nonlocal current_chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
-            current_chunk = ""
+        nonlocal current_len
+        if current_len:
+            chunks.append("".join(current_chunk).strip())
+        current_chunk.clear()
+        current_len = 0
+
+    def append_piece(piece: str):
+        """Append piece to the current chunk without any limit checks."""
+        nonlocal current_len
+        current_chunk.append(piece)
+        current_len += len(piece)
 
     def add_piece(piece: str):
         """Add piece to current chunk, flushing if needed."""
-        nonlocal current_chunk
-
         # If piece alone exceeds limit, it needs further splitting
         if len(piece) > limit:
             return False
 
         # If adding piece would exceed limit, flush current chunk first
-        if current_chunk and len(current_chunk) + len(piece) > limit:
+        if current_len and current_len + len(piece) > limit:
             flush_chunk()
 
-        current_chunk += piece
+        append_piece(piece)
         return True
 
     def split_by_sentences(text: str):
         """Split text by sentence boundaries."""
         # Split on sentence endings followed by space or newline
-        sentences = re.split(r"([.!?]+[\s\n]+)", text)
+        sentences = _SENTENCE_RE.split(text)
 
         # Rejoin punctuation with sentences
         result = []
@@ -408,12 +508,11 @@ def split_whatsapp_message(text: str, limit: int = 1600) -> list[str]:
 
     def split_by_chars(text: str):
         """Hard split text by character limit."""
-        nonlocal current_chunk
         for i in range(0, len(text), limit):
             chunk = text[i : i + limit]
-            if current_chunk and len(current_chunk) + len(chunk) > limit:
+            if current_len and current_len + len(chunk) > limit:
                 flush_chunk()
-            current_chunk += chunk
+            append_piece(chunk)
 
     # Split by paragraphs (double newlines)
     paragraphs = text.split("\n\n")
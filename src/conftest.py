@@ -0,0 +1,14 @@
+import asyncio
+import sys
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Run the async tests on uvloop, as the servers do in production."""
+    if sys.platform == "win32":
+        return asyncio.DefaultEventLoopPolicy()
+    import uvloop
+
+    return uvloop.EventLoopPolicy()